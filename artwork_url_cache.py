@@ -0,0 +1,217 @@
+"""
+Artwork URL Cache
+Remembers which PDF an item link resolves to, so repeat downloads of a PO skip
+the openItemDetail popup and fetch the PDF directly. Rows live in the
+artwork_urls table of po_database.db, keyed by the two openItemDetail IDs and
+the item number, together with when the URL was resolved and the ETag /
+Last-Modified of the last successful fetch.
+
+Every PO page scrape also records the openItemDetail ID pair of each item link
+in item_suffix_ids, which is what the direct
+https://app4.brandid.com/Artwork/{item}_{suffix_id}.pdf downloads need.
+
+Usage:
+    key = artwork_url_cache.make_key(link_onclick, item_number)
+    cached = artwork_url_cache.lookup_many([key, ...])   # {key: row}
+    artwork_url_cache.store(key, pdf_url)                # after resolving through the popup
+    artwork_url_cache.record_fetch(key, response)        # after downloading
+    artwork_url_cache.invalidate(key)                    # on a 404
+
+    artwork_url_cache.store_suffix_ids(po_number, po_page_parser.item_detail_ids(document))
+    suffix_ids = artwork_url_cache.lookup_suffix_ids(item_numbers, po_number)  # {item: suffix_id}
+"""
+
+import re
+import sqlite3
+from datetime import datetime
+
+DATABASE = 'po_database.db'
+
+_ITEM_DETAIL_CALL = re.compile(r"openItemDetail\('(\d+)',\s*'(\d+)'\)")
+_PDF_URL = re.compile(r"MM_openBrWindow\('([^']+\.pdf)'")
+
+_table_ready = False
+
+
+def _connect():
+    global _table_ready
+
+    conn = sqlite3.connect(DATABASE, timeout=10)
+    if not _table_ready:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS artwork_urls (
+                detail_id TEXT NOT NULL,
+                suffix_id TEXT NOT NULL,
+                item_number TEXT NOT NULL,
+                pdf_url TEXT NOT NULL,
+                resolved_at TIMESTAMP,
+                etag TEXT,
+                last_modified TEXT,
+                last_status INTEGER,
+                last_fetched_at TIMESTAMP,
+                PRIMARY KEY (detail_id, suffix_id, item_number)
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS item_suffix_ids (
+                po_number TEXT NOT NULL,
+                item_number TEXT NOT NULL,
+                detail_id TEXT NOT NULL,
+                suffix_id TEXT NOT NULL,
+                seen_at TIMESTAMP,
+                PRIMARY KEY (po_number, item_number, suffix_id)
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_item_suffix_ids_item ON item_suffix_ids(item_number)')
+        conn.commit()
+        _table_ready = True
+    return conn
+
+
+def parse_item_detail_ids(onclick):
+    """"openItemDetail('8026686', '9062056')" -> ('8026686', '9062056'), or (None, None)"""
+    match = _ITEM_DETAIL_CALL.search(onclick or '')
+    return (match.group(1), match.group(2)) if match else (None, None)
+
+
+def parse_pdf_url(onclick):
+    """PDF URL from the popup's Download button onclick, or None"""
+    match = _PDF_URL.search(onclick or '')
+    return match.group(1) if match else None
+
+
+def make_key(onclick, item_number):
+    """Cache key for an item link, or None when its onclick carries no openItemDetail IDs"""
+    detail_id, suffix_id = parse_item_detail_ids(onclick)
+    if detail_id is None:
+        return None
+    return (detail_id, suffix_id, (item_number or '').strip())
+
+
+def lookup_many(keys):
+    """{key: row dict} for the keys that have a cached URL (one query per 300 keys)"""
+    keys = [key for key in dict.fromkeys(keys) if key]
+    found = {}
+    if not keys:
+        return found
+
+    conn = _connect()
+    try:
+        conn.row_factory = sqlite3.Row
+        for start in range(0, len(keys), 300):  # Stay under SQLite's bound-variable limit
+            chunk = keys[start:start + 300]
+            conditions = ' OR '.join(['(detail_id = ? AND suffix_id = ? AND item_number = ?)'] * len(chunk))
+            params = [value for key in chunk for value in key]
+            for row in conn.execute(f'SELECT * FROM artwork_urls WHERE {conditions}', params):
+                found[(row['detail_id'], row['suffix_id'], row['item_number'])] = dict(row)
+    finally:
+        conn.close()
+    return found
+
+
+def store(key, pdf_url):
+    """Remember the PDF URL an item link resolved to"""
+    if not key or not pdf_url:
+        return
+    conn = _connect()
+    try:
+        conn.execute('''
+            INSERT INTO artwork_urls (detail_id, suffix_id, item_number, pdf_url, resolved_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (detail_id, suffix_id, item_number) DO UPDATE SET
+                pdf_url = excluded.pdf_url, resolved_at = excluded.resolved_at,
+                etag = NULL, last_modified = NULL, last_status = NULL, last_fetched_at = NULL
+        ''', (*key, pdf_url, datetime.now().isoformat()))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def record_fetch(key, response):
+    """Keep the status and HTTP validators of the latest fetch of a cached URL"""
+    if not key or response is None:
+        return
+    conn = _connect()
+    try:
+        conn.execute('''
+            UPDATE artwork_urls SET etag = ?, last_modified = ?, last_status = ?, last_fetched_at = ?
+            WHERE detail_id = ? AND suffix_id = ? AND item_number = ?
+        ''', (response.headers.get('ETag'), response.headers.get('Last-Modified'), response.status_code,
+              datetime.now().isoformat(), *key))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def invalidate(key):
+    """Forget a cached URL (the PDF moved or was replaced), so the popup is used again"""
+    if not key:
+        return
+    conn = _connect()
+    try:
+        conn.execute('DELETE FROM artwork_urls WHERE detail_id = ? AND suffix_id = ? AND item_number = ?', key)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def store_suffix_ids(po_number, detail_ids):
+    """Record the (item number, detail id, suffix id) triples harvested from a PO page"""
+    rows = [(str(po_number).strip(), item_number.strip(), detail_id, suffix_id)
+            for item_number, detail_id, suffix_id in detail_ids if item_number and suffix_id]
+    if not rows:
+        return 0
+
+    seen_at = datetime.now().isoformat()
+    conn = _connect()
+    try:
+        conn.executemany('''
+            INSERT INTO item_suffix_ids (po_number, item_number, detail_id, suffix_id, seen_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (po_number, item_number, suffix_id) DO UPDATE SET
+                detail_id = excluded.detail_id, seen_at = excluded.seen_at
+        ''', [row + (seen_at,) for row in rows])
+        conn.commit()
+    finally:
+        conn.close()
+    return len(rows)
+
+
+def lookup_suffix_ids(item_numbers, po_number=None):
+    """{item number: suffix id} for items seen on any scraped PO page
+
+    The item's own PO wins when po_number is given; otherwise the most recently
+    seen suffix id is used (re-uploaded artwork gets a new one).
+    """
+    item_numbers = [number for number in dict.fromkeys((n or '').strip() for n in item_numbers) if number]
+    found = {}
+    if not item_numbers:
+        return found
+
+    po_number = str(po_number).strip() if po_number else ''
+    conn = _connect()
+    try:
+        for start in range(0, len(item_numbers), 500):  # Stay under SQLite's bound-variable limit
+            chunk = item_numbers[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(f'''
+                SELECT item_number, suffix_id FROM item_suffix_ids
+                WHERE item_number IN ({placeholders})
+                ORDER BY (po_number = ?) DESC, seen_at DESC
+            ''', chunk + [po_number])
+            for item_number, suffix_id in rows:
+                found.setdefault(item_number, suffix_id)
+    finally:
+        conn.close()
+    return found
+
+
+def has_suffix_ids(po_number):
+    """True once a page of po_number has been harvested"""
+    conn = _connect()
+    try:
+        row = conn.execute('SELECT 1 FROM item_suffix_ids WHERE po_number = ? LIMIT 1',
+                           (str(po_number).strip(),)).fetchone()
+    finally:
+        conn.close()
+    return row is not None
@@ -0,0 +1,203 @@
+"""
+Persisted E-BrandID Login Session
+Keeps the authenticated cookie jar on disk (brandid_session.json, owner read/write
+only) so scrapes and downloads can skip the login form, including after a restart.
+
+Mode 0600 is only enforced on POSIX. On Windows, where file modes do nothing,
+the jar is encrypted with DPAPI for the current Windows user instead, so other
+accounts (and copies of the file) cannot read the cookies.
+
+A saved jar is checked with one cheap request to the page the login landed on;
+a redirect back to the login page means the session expired and the caller logs
+in again and saves the fresh cookies.
+
+Usage:
+    if not brandid_session.restore(driver, username):
+        ... type credentials and click Login() ...
+        brandid_session.capture(driver, username)
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+
+import rate_limiter
+
+SESSION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'brandid_session.json')
+PROBE_INTERVAL = 120  # seconds a successful probe is trusted before probing again
+
+# Only one thread types credentials when the saved session has expired
+refresh_lock = threading.Lock()
+
+_state_lock = threading.Lock()
+_last_probe = {'saved_at': None, 'checked_at': 0.0, 'valid': False}
+
+# File modes do not protect the jar on Windows, so it is DPAPI-encrypted there
+PROTECT_WITH_DPAPI = os.name == 'nt'
+
+# Fields accepted by CDP Network.setCookies
+_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+
+def _dpapi(data, protect):
+    """Encrypt (protect=True) or decrypt bytes with the Windows user's DPAPI key"""
+    import ctypes
+    from ctypes import wintypes
+
+    class DataBlob(ctypes.Structure):
+        _fields_ = [('cbData', wintypes.DWORD), ('pbData', ctypes.POINTER(ctypes.c_char))]
+
+    buffer = ctypes.create_string_buffer(data, len(data))
+    blob_in = DataBlob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+    blob_out = DataBlob()
+    crypt32 = ctypes.windll.crypt32
+    call = crypt32.CryptProtectData if protect else crypt32.CryptUnprotectData
+    if not call(ctypes.byref(blob_in), None, None, None, None, 0x1, ctypes.byref(blob_out)):  # 0x1: no UI
+        raise ctypes.WinError()
+    try:
+        return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+    finally:
+        ctypes.windll.kernel32.LocalFree(blob_out.pbData)
+
+
+def load():
+    """Saved session dict, or None when there is no readable session file"""
+    try:
+        with open(SESSION_FILE, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        if not PROTECT_WITH_DPAPI:
+            return stored
+        if 'dpapi' not in stored:
+            return None  # A plaintext jar is never trusted on Windows; the next login rewrites it
+        return json.loads(_dpapi(base64.b64decode(stored['dpapi']), protect=False).decode('utf-8'))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save(username, landing_url, cookies):
+    """Write the cookie jar atomically with mode 0600, DPAPI-encrypted on Windows"""
+    session = {
+        'username': username,
+        'landing_url': landing_url,
+        'saved_at': time.time(),
+        'cookies': cookies
+    }
+    stored = session
+    if PROTECT_WITH_DPAPI:
+        stored = {'dpapi': base64.b64encode(_dpapi(json.dumps(session).encode('utf-8'), protect=True)).decode('ascii')}
+
+    tmp_path = SESSION_FILE + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(stored, f)
+    os.chmod(tmp_path, 0o600)  # os.open's mode is ignored when the temp file already existed
+    os.replace(tmp_path, SESSION_FILE)
+
+    # Cookies straight from a successful login need no probe
+    with _state_lock:
+        _last_probe.update(saved_at=session['saved_at'], checked_at=time.monotonic(), valid=True)
+    return session
+
+
+def clear():
+    """Forget the saved session (e.g. after the account in Settings changes)"""
+    try:
+        os.remove(SESSION_FILE)
+    except FileNotFoundError:
+        pass
+    with _state_lock:
+        _last_probe.update(saved_at=None, checked_at=0.0, valid=False)
+
+
+def probe(session):
+    """True if the saved cookies still reach the post-login page without a login redirect"""
+    import requests
+
+    url = session.get('landing_url')
+    if not url:
+        return False
+
+    # Keep cookies apart per (domain, path, name): BrandID hosts can set same-named cookies
+    cookies = requests.cookies.RequestsCookieJar()
+    for cookie in session.get('cookies', []):
+        cookies.set(cookie['name'], cookie['value'],
+                    domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+    try:
+        with rate_limiter.throttled(url) as call:
+            response = requests.get(url, cookies=cookies, allow_redirects=False, timeout=10,
+                                    headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+            call.status_code = response.status_code
+    except Exception as e:
+        print(f"⚠️ Session probe failed: {e}")
+        return False
+
+    # Expired sessions are redirected to login.aspx, or served its form directly
+    return response.status_code == 200 and 'txtUserName' not in response.text
+
+
+def get_valid_session(username):
+    """Saved session for username if it is still logged in, probing at most every PROBE_INTERVAL"""
+    session = load()
+    if not session or session.get('username') != username or not session.get('cookies'):
+        return None
+
+    with _state_lock:
+        if (_last_probe['saved_at'] == session['saved_at']
+                and time.monotonic() - _last_probe['checked_at'] < PROBE_INTERVAL):
+            return session if _last_probe['valid'] else None
+
+    valid = probe(session)
+    with _state_lock:
+        _last_probe.update(saved_at=session['saved_at'], checked_at=time.monotonic(), valid=valid)
+
+    if not valid:
+        print("🔑 Saved E-BrandID session has expired, a fresh login is needed")
+    return session if valid else None
+
+
+def restore(driver, username):
+    """Load the saved cookies into a fresh driver; False means the caller must log in"""
+    session = get_valid_session(username)
+    if not session:
+        return False
+
+    cookies = [{key: cookie[key] for key in _COOKIE_FIELDS if key in cookie}
+               for cookie in session['cookies']]
+    try:
+        # CDP sets cookies for any domain without first navigating to it
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+    except Exception as e:
+        print(f"⚠️ Could not restore saved session: {e}")
+        return False
+
+    print("🔓 Reusing saved E-BrandID session")
+    return True
+
+
+def capture(driver, username):
+    """Save the logged-in driver's BrandID cookies for later jobs"""
+    try:
+        all_cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+    except Exception as e:
+        print(f"⚠️ Could not read session cookies: {e}")
+        return None
+
+    cookies = []
+    for cookie in all_cookies:
+        if 'brandid.com' not in cookie.get('domain', ''):
+            continue
+        kept = {key: cookie[key] for key in _COOKIE_FIELDS if key in cookie}
+        if cookie.get('session') or kept.get('expires', -1) <= 0:
+            kept.pop('expires', None)  # Session cookie: no expiry to restore
+        cookies.append(kept)
+
+    if not cookies:
+        return None
+
+    try:
+        return save(username, driver.current_url, cookies)
+    except OSError as e:
+        print(f"⚠️ Could not save session: {e}")
+        return None
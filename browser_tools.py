@@ -0,0 +1,414 @@
+"""
+Chrome Launch Helpers
+Resolves the ChromeDriver binary once per process and remembers the path per
+installed Chrome version in chromedriver_cache.json, so later launches (and
+later runs, even offline) skip webdriver_manager's version probing and network
+checks. Every launch is timed for the /api/browser/status endpoint.
+
+Also the wait toolkit used instead of fixed sleeps: each helper waits on an
+explicit condition (document ready, a stable row count, a new window, a
+finished download) and records how long the site actually took.
+
+Scraping and download browsers can be launched with block_resources=True:
+images are turned off through content-setting prefs (profile-wide, so popups
+too) and CDP Network.setBlockedURLs drops fonts, stylesheets, media and tracker
+requests a PO page never needs. CDP blocking only applies to the window it was
+issued in, so popups are entered with switch_to_window(), which re-issues it.
+PDFs are never blocked, so downloads through the popups still work.
+
+Usage:
+    driver = browser_tools.launch_chrome(chrome_options, block_resources=True)
+    browser_tools.wait_for_page_ready(driver, old_page)
+    popup = browser_tools.wait_for_new_window(driver, handles_before)
+    browser_tools.switch_to_window(driver, popup)
+"""
+
+import json
+import os
+import threading
+import time
+
+DRIVER_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chromedriver_cache.json')
+
+_resolve_lock = threading.Lock()
+_resolved = {
+    'chrome_version': None,
+    'driver_path': None,
+    'source': None,          # 'cache', 'webdriver_manager' or 'selenium' (Selenium Manager / PATH)
+    'resolve_seconds': None
+}
+
+_launch_lock = threading.Lock()
+_launch_stats = {'launches': 0, 'total_seconds': 0.0, 'last_seconds': None, 'slowest_seconds': 0.0}
+
+# Per wait name: how many times it ran, how long it took, how often it timed out
+_wait_lock = threading.Lock()
+_wait_stats = {}
+
+POLL_INTERVAL = 0.05  # seconds between condition checks
+
+# Requests a scraping browser never needs (CDP wildcard patterns)
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.bmp', '*.ico', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css',
+    '*.mp4', '*.webm', '*.mp3', '*.swf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*facebook.net*', '*hotjar.com*'
+]
+
+# Per page name: transfer size and load time of pages loaded by scrapers
+_page_lock = threading.Lock()
+_page_stats = {}
+
+_PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+const resourceBytes = resources.reduce((total, r) => total + (r.transferSize || r.encodedBodySize || 0), 0);
+return {
+    resources: resources.length,
+    transfer_bytes: resourceBytes + (nav ? (nav.transferSize || nav.encodedBodySize || 0) : 0),
+    load_ms: nav ? Math.round(nav.loadEventEnd || nav.duration) : null
+};
+"""
+
+
+def detect_chrome_version():
+    """Installed Chrome version (e.g. '120.0.6099'), or None when it cannot be read"""
+    try:
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def _load_cache():
+    try:
+        with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    tmp_path = DRIVER_CACHE_FILE + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, DRIVER_CACHE_FILE)
+    except OSError as e:
+        print(f"⚠️ Could not save ChromeDriver cache: {e}")
+
+
+def resolve_chromedriver(refresh=False):
+    """Path to a ChromeDriver matching the installed Chrome, or None to let Selenium find one
+
+    The first call per process does the work; refresh=True ignores the cached path
+    (used when the cached driver no longer starts, e.g. after a Chrome update).
+    """
+    with _resolve_lock:
+        if _resolved['source'] is not None and not refresh:
+            return _resolved['driver_path']
+
+        started = time.monotonic()
+        version = _resolved['chrome_version'] or detect_chrome_version()
+        cache = _load_cache()
+        path = None
+        source = 'cache'
+
+        if not refresh:
+            if version:
+                path = cache.get(version)
+            else:
+                # Version unreadable: fall back to the most recently cached driver
+                path = next(iter(reversed(list(cache.values()))), None)
+            if path and not os.path.isfile(path):
+                path = None
+
+        if path is None:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                path = ChromeDriverManager().install()
+                source = 'webdriver_manager'
+                if version:
+                    cache[version] = path
+                    _save_cache(cache)
+            except Exception as e:
+                print(f"⚠️ ChromeDriverManager failed ({e}), letting Selenium locate the driver")
+                source = 'selenium'
+
+        _resolved.update(
+            chrome_version=version,
+            driver_path=path,
+            source=source,
+            resolve_seconds=round(time.monotonic() - started, 3)
+        )
+        print(f"🧭 ChromeDriver resolved via {source} in {_resolved['resolve_seconds']}s (Chrome {version or 'unknown'})")
+        return path
+
+
+def _start_chrome(path, chrome_options):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    if path:
+        return webdriver.Chrome(service=Service(path), options=chrome_options)
+    return webdriver.Chrome(options=chrome_options)
+
+
+def apply_scrape_profile(chrome_options):
+    """Turn images off via content-setting prefs (current Chrome ignores --disable-images)"""
+    prefs = dict(chrome_options.experimental_options.get('prefs', {}))
+    prefs['profile.managed_default_content_settings.images'] = 2
+    chrome_options.add_experimental_option('prefs', prefs)
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+
+
+def enable_resource_blocking(driver, patterns=None):
+    """Drop matching requests at the network layer; returns False if CDP is unavailable"""
+    patterns = list(patterns or BLOCKED_URL_PATTERNS)
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    except Exception as e:
+        print(f"⚠️ Resource blocking unavailable: {e}")
+        return False
+    driver.blocked_url_patterns = patterns  # Re-issued by switch_to_window for each popup
+    return True
+
+
+def switch_to_window(driver, handle):
+    """Switch to a window (usually a popup), blocking resources there too if the driver blocks them"""
+    driver.switch_to.window(handle)
+    patterns = getattr(driver, 'blocked_url_patterns', None)
+    if patterns:
+        enable_resource_blocking(driver, patterns)
+
+
+def launch_chrome(chrome_options, block_resources=False):
+    """Start Chrome with the resolved driver and record how long the launch took
+
+    block_resources=True applies the scraping profile (no images, fonts, CSS or trackers).
+    """
+    started = time.monotonic()
+    if block_resources:
+        apply_scrape_profile(chrome_options)
+    path = resolve_chromedriver()
+
+    try:
+        driver = _start_chrome(path, chrome_options)
+    except Exception as e:
+        if path is None:
+            raise  # Selenium Manager itself failed; nothing left to fall back to
+        driver = None
+        error = e
+        if _resolved['source'] == 'cache':
+            print(f"⚠️ Cached ChromeDriver failed to start ({e}), resolving again...")
+            path = resolve_chromedriver(refresh=True)
+            if path:
+                try:
+                    driver = _start_chrome(path, chrome_options)
+                except Exception as retry_error:
+                    error = retry_error
+        if driver is None:
+            # Last resort, as before the driver cache: let Selenium Manager find a driver
+            print(f"⚠️ ChromeDriver failed to start ({error}), letting Selenium locate the driver")
+            driver = _start_chrome(None, chrome_options)
+
+    if block_resources:
+        enable_resource_blocking(driver)
+
+    elapsed = time.monotonic() - started
+    with _launch_lock:
+        _launch_stats['launches'] += 1
+        _launch_stats['total_seconds'] += elapsed
+        _launch_stats['last_seconds'] = round(elapsed, 3)
+        _launch_stats['slowest_seconds'] = round(max(_launch_stats['slowest_seconds'], elapsed), 3)
+    return driver
+
+
+def _record_wait(name, started, timed_out):
+    elapsed = time.monotonic() - started
+    with _wait_lock:
+        stats = _wait_stats.setdefault(name, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0,
+                                              'last_seconds': None, 'timeouts': 0})
+        stats['count'] += 1
+        stats['total_seconds'] += elapsed
+        stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+        stats['last_seconds'] = round(elapsed, 3)
+        if timed_out:
+            stats['timeouts'] += 1
+    return elapsed
+
+
+def wait_for_page_ready(driver, old_page=None, timeout=15):
+    """Wait until a navigation has replaced old_page (if given) and the document is complete
+
+    old_page is any element of the previous page, usually driver.find_element(By.TAG_NAME, 'html')
+    taken before clicking; without it a click could see the old page's readyState.
+    Returns False on timeout (the caller carries on with whatever has loaded).
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    started = time.monotonic()
+    wait = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL)
+    try:
+        if old_page is not None:
+            wait.until(EC.staleness_of(old_page))
+        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+        ready = True
+    except TimeoutException:
+        ready = False
+    _record_wait('page_ready', started, not ready)
+    return ready
+
+
+def wait_for_stable_count(driver, css_selector, timeout=15, settle=0.5, min_count=1, name=None, empty_script=None):
+    """Wait until at least min_count elements match and the count holds for settle seconds
+
+    Pages that fill their item table in several passes are only read once the
+    row count stops moving. empty_script is JS returning true once the page has
+    finished rendering with nothing to match (e.g. an item table with no rows);
+    a settled count below min_count is then accepted instead of waiting out the
+    timeout. Returns the final count (possibly below min_count on timeout).
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    script = 'return document.querySelectorAll(arguments[0]).length'
+    last_count = -1
+    last_change = started
+
+    while True:
+        now = time.monotonic()
+        try:
+            count = driver.execute_script(script, css_selector)
+        except Exception:
+            count = 0  # Mid-navigation: the document is being replaced
+        if count != last_count:
+            last_count = count
+            last_change = now
+        elif now - last_change >= settle and (count >= min_count or _page_is_empty(driver, empty_script)):
+            _record_wait(name or 'stable_count', started, False)
+            return count
+        if now >= deadline:
+            _record_wait(name or 'stable_count', started, True)
+            return count
+        time.sleep(POLL_INTERVAL)
+
+
+def _page_is_empty(driver, empty_script):
+    if not empty_script:
+        return False
+    try:
+        return bool(driver.execute_script(empty_script))
+    except Exception:
+        return False  # Mid-navigation: ask again on the next poll
+
+
+def wait_for_new_window(driver, handles_before, timeout=10):
+    """Handle of a window opened since handles_before was taken, or None on timeout"""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    handles_before = list(handles_before)
+    started = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(EC.new_window_is_opened(handles_before))
+    except TimeoutException:
+        _record_wait('new_window', started, True)
+        return None
+    _record_wait('new_window', started, False)
+
+    new_handles = [handle for handle in driver.window_handles if handle not in handles_before]
+    return new_handles[-1] if new_handles else None
+
+
+def wait_for_download(folder, files_before, timeout=30, pattern='*.pdf'):
+    """Path of a new, fully written file in folder, or None on timeout
+
+    Chrome writes to a .crdownload file first and renames it when finished,
+    so a new name matching pattern means the download is complete.
+    """
+    import glob
+
+    files_before = set(files_before)
+    started = time.monotonic()
+    deadline = started + timeout
+    while True:
+        new_files = set(glob.glob(os.path.join(folder, pattern))) - files_before
+        if new_files:
+            _record_wait('download', started, False)
+            return max(new_files, key=os.path.getmtime)
+        if time.monotonic() >= deadline:
+            _record_wait('download', started, True)
+            return None
+        time.sleep(POLL_INTERVAL * 2)
+
+
+def measure_page(driver):
+    """Resource count, bytes transferred and load time of the current page (Resource Timing API)"""
+    try:
+        return driver.execute_script(_PAGE_METRICS_SCRIPT)
+    except Exception:
+        return None
+
+
+def record_page_load(driver, name):
+    """Measure the current page and add it to the per-name page statistics"""
+    metrics = measure_page(driver)
+    if not metrics:
+        return None
+    with _page_lock:
+        stats = _page_stats.setdefault(name, {'count': 0, 'total_bytes': 0, 'total_load_ms': 0, 'timed': 0})
+        stats['count'] += 1
+        stats['total_bytes'] += metrics['transfer_bytes']
+        if metrics['load_ms'] is not None:
+            stats['total_load_ms'] += metrics['load_ms']
+            stats['timed'] += 1
+    return metrics
+
+
+def get_page_stats():
+    """Average transfer size and load time per page name"""
+    with _page_lock:
+        return {
+            name: {
+                'count': stats['count'],
+                'average_bytes': round(stats['total_bytes'] / stats['count']),
+                'average_load_ms': round(stats['total_load_ms'] / stats['timed']) if stats['timed'] else None
+            }
+            for name, stats in _page_stats.items()
+        }
+
+
+def get_wait_stats():
+    """Recorded wait durations per wait name"""
+    with _wait_lock:
+        return {
+            name: {
+                'count': stats['count'],
+                'average_seconds': round(stats['total_seconds'] / stats['count'], 3),
+                'max_seconds': round(stats['max_seconds'], 3),
+                'last_seconds': stats['last_seconds'],
+                'timeouts': stats['timeouts']
+            }
+            for name, stats in _wait_stats.items()
+        }
+
+
+def get_stats():
+    """Driver resolution, launch timings, wait durations and page sizes"""
+    with _launch_lock:
+        launches = _launch_stats['launches']
+        launch = {
+            'launches': launches,
+            'last_launch_seconds': _launch_stats['last_seconds'],
+            'average_launch_seconds': round(_launch_stats['total_seconds'] / launches, 3) if launches else None,
+            'slowest_launch_seconds': _launch_stats['slowest_seconds'] if launches else None
+        }
+    with _resolve_lock:
+        resolved = dict(_resolved)
+    return {**resolved, **launch, 'waits': get_wait_stats(), 'pages': get_page_stats()}
@@ -0,0 +1,240 @@
+"""
+PO Page Parser
+Reads a factoryPODetail.aspx page in one pass. The HTML is parsed once with lxml;
+header fields come from a label -> value map (label cell followed by value cell,
+or "Label: value" in one element, plus one precompiled scan of the page text for
+"Label: value" lines the markup doesn't pair up), and the item table is read from
+the same parsed document.
+
+Usage:
+    po_header, items = po_page_parser.parse_po_page(driver.page_source)
+
+    # Or parse once and take each part from the same document
+    document = po_page_parser.parse_document(driver.page_source)
+    detail_ids = po_page_parser.item_detail_ids(document)
+"""
+
+import re
+
+# Header field -> label aliases, in order of preference
+PO_HEADER_FIELDS = {
+    'factory': ['Factory', 'Manufacturer'],
+    'po_date': ['PO Date', 'Order Date', 'Date'],
+    'ship_by': ['Ship By', 'Delivery Date', 'Ship Date'],
+    'ship_via': ['Ship Via', 'Shipping Method', 'Delivery Method'],
+    'order_type': ['Order Type', 'Type'],
+    'status': ['Status', 'Order Status'],
+    'location': ['Loc', 'Location'],
+    'prod_rep': ['Prod Rep', 'Production Rep', 'Rep'],
+    'purchase_from': ['Purchased From', 'Purchase From', 'Vendor', 'Supplier'],
+    'ship_to': ['Ship To', 'Shipping Address', 'Delivery Address'],
+    'ship_to_address': ['Ship To Address', 'Ship-To Address'],
+    'company': ['Company', 'Client'],
+    'currency': ['Currency', 'Curr'],
+    'cancel_date': ['Cancel Date', 'Deadline', 'Due Date'],
+    'terms': ['Terms', 'Payment Terms']
+}
+
+MAX_LABEL_LENGTH = 40
+MAX_VALUE_LENGTH = 200
+
+_WHITESPACE = re.compile(r'\s+')
+# Fallback for text like "Ship Via: UPS Ground" on its own line
+_LABEL_LINE = re.compile(r'^[ \t]*([A-Za-z][A-Za-z0-9 ./#&()-]{0,39}?)[ \t]*:[ \t]*(\S[^\n]*?)[ \t]*$', re.MULTILINE)
+_LABEL_TAGS = ('td', 'th', 'span', 'label', 'div', 'b', 'strong', 'font')
+
+# Item table columns, left to right
+ITEM_COLUMNS = ('name', 'description', 'color', 'ship_to', 'need_by', 'quantity', 'bundle_qty', 'unit_price', 'extension')
+_ITEM_DETAIL_CALL = re.compile(r"openItemDetail\('(\d+)',\s*'(\d+)'\)")
+_NOT_ITEM_NUMBERS = ('Item #', 'Total:', 'Description')
+
+
+def normalize_label(label):
+    """'  Ship  By: ' -> 'ship by'"""
+    return _WHITESPACE.sub(' ', label).strip().rstrip(':').strip().lower()
+
+
+def clean_value(value):
+    """Collapse whitespace and drop values that are clearly not field data ('' if rejected)"""
+    value = _WHITESPACE.sub(' ', value or '').strip()
+    if len(value) <= 1 or len(value) >= MAX_VALUE_LENGTH:
+        return ''
+    if value.lower().startswith(('http', 'javascript', 'function', 'var ', 'if ', 'for ')):
+        return ''
+    return value
+
+
+def _element_text(element):
+    return _WHITESPACE.sub(' ', element.text_content()).strip()
+
+
+def _next_element(element):
+    sibling = element.getnext()
+    while sibling is not None and not isinstance(sibling.tag, str):
+        sibling = sibling.getnext()  # Skip comments / processing instructions
+    return sibling
+
+
+def parse_document(html):
+    """lxml document for a page, or None if it cannot be parsed"""
+    import lxml.html
+
+    if not html:
+        return None
+    try:
+        return lxml.html.fromstring(html)
+    except Exception:
+        return None
+
+
+def label_values(document):
+    """{normalized label: value} for a parsed page; the first occurrence wins"""
+    labels = {}
+    if document is None:
+        return labels
+
+    for element in document.iter(*_LABEL_TAGS):
+        text = _element_text(element)
+        if not text or len(text) > MAX_LABEL_LENGTH + MAX_VALUE_LENGTH:
+            continue
+
+        # "Label" cell followed by its value cell
+        if len(text) <= MAX_LABEL_LENGTH:
+            sibling = _next_element(element)
+            if sibling is not None and sibling.tag != 'th':  # th after th is a column header row
+                value = clean_value(_element_text(sibling))
+                label = normalize_label(text)
+                if value and label and normalize_label(value) != label:
+                    labels.setdefault(label, value)
+
+        # "Label: value" inside a single element
+        if ':' in text:
+            label, _, value = text.partition(':')
+            label = normalize_label(label)
+            value = clean_value(value)
+            if label and value and len(label) <= MAX_LABEL_LENGTH:
+                labels.setdefault(label, value)
+
+    # One scan of the rendered text catches labels the markup doesn't pair up
+    page_text = '\n'.join(line.strip() for line in document.itertext())
+    for match in _LABEL_LINE.finditer(page_text):
+        value = clean_value(match.group(2))
+        if value:
+            labels.setdefault(normalize_label(match.group(1)), value)
+
+    return labels
+
+
+def parse_label_values(html):
+    """Parse the page once and return {normalized label: value}"""
+    return label_values(parse_document(html))
+
+
+def header_fields(labels, fields=None):
+    """Map each header field to the value of its first alias in labels ('' if none)"""
+    header = {}
+    for field, aliases in (fields or PO_HEADER_FIELDS).items():
+        header[field] = next((labels[normalize_label(alias)] for alias in aliases
+                              if normalize_label(alias) in labels), '')
+    return header
+
+
+def extract_header_fields(html, fields=None):
+    """Header fields straight from page HTML"""
+    return header_fields(parse_label_values(html), fields)
+
+
+def _score_item_table(table):
+    """True if a table looks like the PO item table (expected headers or several item links)"""
+    for row in table.iter('tr'):
+        header_cells = row.xpath('.//th')
+        if len(header_cells) >= 5:
+            header_text = ' '.join(_element_text(cell) for cell in header_cells).lower()
+            score = 0
+            if 'item' in header_text: score += 3
+            if 'description' in header_text: score += 3
+            if 'color' in header_text: score += 2
+            if 'qty' in header_text or 'quantity' in header_text: score += 2
+            if 'ship' in header_text: score += 1
+            if 'need' in header_text or 'date' in header_text: score += 1
+            if score >= 6:
+                return True
+
+    return len(table.xpath(".//a[contains(@onclick, 'openItemDetail')]")) >= 2
+
+
+def _is_item_row(item_number, description):
+    """Item numbers mix letters and digits; header, total and row-number rows do not"""
+    return bool(
+        item_number and len(item_number) > 3 and
+        item_number not in _NOT_ITEM_NUMBERS and
+        not item_number.startswith('#') and
+        description and len(description) > 5 and
+        description not in ('Item #', 'Description') and
+        any(c.isalpha() for c in item_number) and
+        any(c.isdigit() for c in item_number)
+    )
+
+
+def extract_items(document):
+    """Rows of the first item table on a parsed page, de-duplicated by item number"""
+    if document is None:
+        return []
+
+    items = []
+    for table in document.iter('table'):
+        if not _score_item_table(table):
+            continue
+
+        for row in table.xpath('.//tr')[1:]:  # Skip header
+            cell_texts = [_element_text(cell) for cell in row.xpath('.//td')]
+            if len(cell_texts) < 4:
+                continue
+
+            item = {column: (cell_texts[i] if i < len(cell_texts) else '') for i, column in enumerate(ITEM_COLUMNS)}
+            if not _is_item_row(item['name'], item['description']):
+                continue
+
+            # openItemDetail('8026686', '9062056'): the second argument is the artwork suffix id
+            suffix_id = ''
+            detail_links = row.xpath(".//a[contains(@onclick, 'openItemDetail')]")
+            if detail_links:
+                match = _ITEM_DETAIL_CALL.search(detail_links[0].get('onclick', ''))
+                if match:
+                    suffix_id = match.group(2)
+
+            item['has_download'] = bool(detail_links)
+            item['suffix_id'] = suffix_id
+            items.append(item)
+
+        if items:  # Even 1 valid item means this was the item table
+            break
+
+    seen = set()
+    unique_items = []
+    for item in items:
+        key = item['name'].strip().upper()
+        if key not in seen:
+            seen.add(key)
+            unique_items.append(item)
+    return unique_items
+
+
+def item_detail_ids(document):
+    """[(item number, detail id, suffix id)] for every openItemDetail link on a parsed page"""
+    if document is None:
+        return []
+
+    pairs = []
+    for link in document.xpath("//a[contains(@onclick, 'openItemDetail')]"):
+        match = _ITEM_DETAIL_CALL.search(link.get('onclick', ''))
+        item_number = _element_text(link)
+        if match and item_number:
+            pairs.append((item_number, match.group(1), match.group(2)))
+    return pairs
+
+
+def parse_po_page(html, fields=None):
+    """(header fields, items) from one parse of a PO detail page"""
+    document = parse_document(html)
+    return header_fields(label_values(document), fields), extract_items(document)
@@ -0,0 +1,185 @@
+"""
+Shared Rate Limiter for BrandID Traffic
+One token bucket per host (app.e-brandid.com, app4.brandid.com, ...), shared by
+every scraping and download path in the process.
+
+Buckets back off adaptively: a 429/5xx reply or a failed request halves the
+effective rate and pauses the host briefly (or for Retry-After seconds), a slow
+reply trims the rate, and healthy replies slowly recover it back to the
+configured maximum.
+
+Usage:
+    with rate_limiter.throttled(url) as call:
+        response = requests.get(url)
+        call.status_code = response.status_code
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+# Defaults; adjustable at runtime from the Settings tab via configure()
+settings = {
+    'requests_per_second': 4.0,    # sustained rate per host when the server is healthy
+    'burst': 4,                    # requests allowed back-to-back before pacing kicks in
+    'slow_response_seconds': 5.0,  # replies slower than this count as "server is struggling"
+    'max_backoff_seconds': 30.0    # longest pause after errors
+}
+
+MAX_PENALTY = 16.0  # the effective rate never drops below requests_per_second / 16
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+class HostBucket:
+    """Token bucket for one host with an adaptive rate penalty"""
+
+    def __init__(self, host):
+        self.host = host
+        self.lock = threading.Lock()
+        self.tokens = float(settings['burst'])
+        self.updated = time.monotonic()
+        self.penalty = 1.0        # effective rate = requests_per_second / penalty
+        self.blocked_until = 0.0  # monotonic time before which nothing is sent
+        self.requests = 0
+        self.errors = 0
+        self.total_wait = 0.0
+
+    def effective_rate(self):
+        return settings['requests_per_second'] / self.penalty
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        self.updated = now
+        self.tokens = min(float(settings['burst']), self.tokens + elapsed * self.effective_rate())
+
+    def acquire(self):
+        """Block until a request to this host may be sent; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    self.total_wait += waited
+                    return waited
+                else:
+                    delay = (1 - self.tokens) / self.effective_rate()
+            time.sleep(delay)
+            waited += delay
+
+    def report(self, status_code=None, elapsed=None, error=False, retry_after=None):
+        """Feed back how the request went so the bucket can slow down or recover"""
+        with self.lock:
+            now = time.monotonic()
+            if error or status_code == 429 or (status_code is not None and status_code >= 500):
+                self.errors += 1
+                self.penalty = min(self.penalty * 2, MAX_PENALTY)
+                pause = retry_after if retry_after is not None else self.penalty / settings['requests_per_second']
+                self.blocked_until = max(self.blocked_until, now + min(pause, settings['max_backoff_seconds']))
+                self.tokens = 0
+            elif elapsed is not None and elapsed > settings['slow_response_seconds']:
+                self.penalty = min(self.penalty * 1.5, MAX_PENALTY)
+            else:
+                self.penalty = max(1.0, self.penalty * 0.9)
+
+    def stats(self):
+        with self.lock:
+            return {
+                'host': self.host,
+                'effective_rate': round(self.effective_rate(), 2),
+                'penalty': round(self.penalty, 2),
+                'paused_for': round(max(0.0, self.blocked_until - time.monotonic()), 1),
+                'requests': self.requests,
+                'errors': self.errors,
+                'total_wait_seconds': round(self.total_wait, 1)
+            }
+
+
+class ThrottledCall:
+    """Handle yielded by throttled(); set status_code / retry_after from the response"""
+
+    def __init__(self):
+        self.status_code = None
+        self.retry_after = None
+
+
+def host_of(url_or_host):
+    """'https://app4.brandid.com/Artwork/x.pdf' -> 'app4.brandid.com'"""
+    if '://' in url_or_host:
+        return urlparse(url_or_host).hostname or url_or_host
+    return url_or_host
+
+
+def get_bucket(url_or_host):
+    host = host_of(url_or_host)
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = HostBucket(host)
+        return bucket
+
+
+def acquire(url_or_host):
+    """Wait for permission to send one request to the URL's host"""
+    return get_bucket(url_or_host).acquire()
+
+
+def report(url_or_host, status_code=None, elapsed=None, error=False, retry_after=None):
+    get_bucket(url_or_host).report(status_code, elapsed, error, retry_after)
+
+
+class throttled:
+    """Context manager: acquire a token, time the request and report the outcome"""
+
+    def __init__(self, url_or_host):
+        self.bucket = get_bucket(url_or_host)
+        self.call = ThrottledCall()
+
+    def __enter__(self):
+        self.bucket.acquire()
+        self.started = time.monotonic()
+        return self.call
+
+    def __exit__(self, exc_type, exc, tb):
+        self.bucket.report(
+            status_code=self.call.status_code,
+            elapsed=time.monotonic() - self.started,
+            error=exc_type is not None,
+            retry_after=self.call.retry_after
+        )
+        return False
+
+
+def parse_retry_after(value):
+    """Seconds from a Retry-After header (only the delta-seconds form), or None"""
+    try:
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def configure(**new_settings):
+    """Update limiter settings; unknown keys raise ValueError"""
+    for key, value in new_settings.items():
+        if key not in settings:
+            raise ValueError(f"Unknown rate limit setting: {key}")
+        value = float(value)
+        if value <= 0:
+            raise ValueError(f"{key} must be greater than 0")
+        settings[key] = max(1, int(round(value))) if key == 'burst' else value
+
+
+def get_stats():
+    """Current settings plus per-host state, for the Settings tab"""
+    with _buckets_lock:
+        buckets = list(_buckets.values())
+    return {
+        'settings': dict(settings),
+        'hosts': [bucket.stats() for bucket in buckets]
+    }
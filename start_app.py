@@ -13,40 +13,45 @@ import threading
 import webbrowser
 from pathlib import Path
 
-def start_flask_app():
+def start_flask_app(server_args=()):
     """Start the Flask application"""
     print("🚀 Starting Flask application...")
     try:
         # Run the smart_app.py file
-        subprocess.run([sys.executable, "smart_app.py"], check=True)
+        subprocess.run([sys.executable, "smart_app.py", *server_args], check=True)
     except subprocess.CalledProcessError as e:
         print(f"❌ Error starting Flask app: {e}")
     except KeyboardInterrupt:
         print("\n🛑 Flask app stopped by user")
 
-def wait_for_server(timeout=30):
-    """Wait for the Flask server to be ready"""
-    import requests
+def wait_for_server(timeout=30, poll_interval=0.1):
+    """Wait for the Flask server to report ready on /healthz"""
+    import urllib.request
+    import urllib.error
     start_time = time.time()
+    last_notice = 0
 
     # Try both localhost and 127.0.0.1 on port 5002
     urls_to_try = [
-        "http://localhost:5002",
-        "http://127.0.0.1:5002"
+        "http://127.0.0.1:5002",
+        "http://localhost:5002"
     ]
 
     while time.time() - start_time < timeout:
         for url in urls_to_try:
             try:
-                response = requests.get(url, timeout=2)
-                if response.status_code == 200:
-                    print(f"✅ Server is ready at {url}")
-                    return url
-            except requests.exceptions.RequestException:
+                with urllib.request.urlopen(f"{url}/healthz", timeout=1) as response:
+                    if response.status == 200:
+                        print(f"✅ Server is ready at {url} ({time.time() - start_time:.1f}s)")
+                        return url
+            except (urllib.error.URLError, OSError):
                 pass
 
-        print("⏳ Waiting for server to start...")
-        time.sleep(2)
+        # Poll quickly, but only print the waiting message about once a second
+        if time.time() - last_notice >= 1:
+            print("⏳ Waiting for server to start...")
+            last_notice = time.time()
+        time.sleep(poll_interval)
 
     print(f"❌ Server did not start within {timeout} seconds")
     return None
@@ -91,8 +96,22 @@ def open_chrome_browser(url):
             print(f"❌ Failed to open browser: {e}")
             print(f"📝 Please manually open: {url}")
 
+def parse_args():
+    """Serving options passed through to smart_app.py"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='BID Smart App Launcher')
+    parser.add_argument('--server', choices=['dev', 'waitress'], default='waitress',
+                        help='waitress = multi-threaded production server (default), dev = Flask development server')
+    parser.add_argument('--threads', type=int, default=8, help='waitress worker threads')
+    parser.add_argument('--connection-limit', type=int, default=100, help='waitress max open connections')
+    parser.add_argument('--channel-timeout', type=int, default=120, help='waitress idle connection timeout (seconds)')
+    return parser.parse_args()
+
 def main():
     """Main function to start both Flask app and browser"""
+    args = parse_args()
+
     print("=" * 60)
     print("🎯 BID Smart App Launcher")
     print("=" * 60)
@@ -105,16 +124,24 @@ def main():
         return
     
     print("✅ Found smart_app.py")
-    
+    print(f"🏭 Server mode: {args.server}")
+
+    server_args = ["--server", args.server]
+    if args.server == 'waitress':
+        server_args += [
+            "--threads", str(args.threads),
+            "--connection-limit", str(args.connection_limit),
+            "--channel-timeout", str(args.channel_timeout)
+        ]
+
     # Start Flask app in a separate thread
-    flask_thread = threading.Thread(target=start_flask_app, daemon=True)
+    flask_thread = threading.Thread(target=start_flask_app, args=(server_args,), daemon=True)
     flask_thread.start()
     
     # Wait for the server to be ready
     server_url = wait_for_server()
     if server_url:
-        # Open Chrome browser
-        time.sleep(1)  # Small delay to ensure server is fully ready
+        # Open Chrome browser (/healthz already confirmed the server is ready)
         open_chrome_browser(server_url)
         
         print("\n" + "=" * 60)
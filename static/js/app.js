@@ -0,0 +1,456 @@
+        let selectedMethod = null;
+        let currentPO = null;
+        window.currentPoData = null;  // Global variable for checkbox functions
+
+        // Progress Notification System
+        let notificationCounter = 0;
+        const activeNotifications = new Map();
+
+        function showProgressNotification(id, message, type = 'processing', icon = '🔄') {
+            const container = document.getElementById('notification-container');
+
+            // Check if notification already exists
+            let notification = document.getElementById(`notification-${id}`);
+
+            if (!notification) {
+                // Create new notification
+                notification = document.createElement('div');
+                notification.id = `notification-${id}`;
+                notification.className = `notification ${type}`;
+
+                notification.innerHTML = `
+                    <div class="notification-icon">${icon}</div>
+                    <div class="notification-content">${message}</div>
+                    <button class="notification-close" onclick="removeNotification('${id}')">&times;</button>
+                `;
+
+                container.appendChild(notification);
+
+                // Trigger animation
+                setTimeout(() => {
+                    notification.classList.add('show');
+                }, 100);
+
+                // Store in active notifications
+                activeNotifications.set(id, notification);
+            } else {
+                // Update existing notification
+                const iconEl = notification.querySelector('.notification-icon');
+                const contentEl = notification.querySelector('.notification-content');
+
+                iconEl.textContent = icon;
+                contentEl.textContent = message;
+
+                // Update type class
+                notification.className = `notification show ${type}`;
+            }
+
+            return notification;
+        }
+
+        function updateNotification(id, message, type = 'success', icon = '✅', autoRemove = true) {
+            const notification = showProgressNotification(id, message, type, icon);
+
+            if (autoRemove) {
+                // Auto-remove success notifications after 4 seconds
+                setTimeout(() => {
+                    removeNotification(id);
+                }, 4000);
+            }
+        }
+
+        function removeNotification(id) {
+            const notification = document.getElementById(`notification-${id}`);
+            if (notification) {
+                notification.classList.remove('show');
+                setTimeout(() => {
+                    if (notification.parentNode) {
+                        notification.parentNode.removeChild(notification);
+                    }
+                    activeNotifications.delete(id);
+                }, 300);
+            }
+        }
+
+        function clearAllNotifications() {
+            activeNotifications.forEach((notification, id) => {
+                removeNotification(id);
+            });
+        }
+
+        // Method selection
+        document.addEventListener('DOMContentLoaded', function() {
+            // Set Method 5 as default
+            selectedMethod = 'guaranteed_complete';
+
+            // Add click handlers for method cards
+            document.querySelectorAll('.method-card').forEach(card => {
+                card.addEventListener('click', function() {
+                    // Remove selected class from all cards
+                    document.querySelectorAll('.method-card').forEach(c => c.classList.remove('selected'));
+                    // Add selected class to clicked card
+                    this.classList.add('selected');
+                    // Update selected method
+                    selectedMethod = this.dataset.method;
+                    console.log('Selected method:', selectedMethod);
+                });
+            });
+
+            // Restore form state on page load
+            restoreFormState();
+
+            // Artwork is the tab shown on load
+            loadTabModule('artwork');
+        });
+
+        // Per-tab modules are imported the first time their tab opens, then reused;
+        // tabs missing from the page shell fetch their markup alongside the module
+        const tabModules = {};
+
+        function loadTabMarkup(tabName) {
+            const url = window.TAB_MARKUP_URLS[tabName];
+            if (!url) {
+                return Promise.resolve();
+            }
+            return fetch(url)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`${tabName} markup returned HTTP ${response.status}`);
+                    }
+                    return response.text();
+                })
+                .then(html => {
+                    document.getElementById(tabName).innerHTML = html;
+                });
+        }
+
+        function loadTabModule(tabName) {
+            if (!tabModules[tabName]) {
+                tabModules[tabName] = Promise.all([loadTabMarkup(tabName), import(window.TAB_MODULE_URLS[tabName])])
+                    .then(([, module]) => {
+                        // Inline onclick handlers look functions up on window; initTab runs once the markup is in place
+                        const { initTab, ...handlers } = module;
+                        Object.assign(window, handlers);
+                        if (initTab) {
+                            initTab();
+                        }
+                        return module;
+                    })
+                    .catch(error => {
+                        delete tabModules[tabName];
+                        showError('❌ Error loading tab: ' + error.message, 'error');
+                        throw error;
+                    });
+            }
+            return tabModules[tabName];
+        }
+
+        // State preservation functions
+        function saveFormState() {
+            // Fields of tabs whose markup has not loaded yet keep their saved values
+            const state = JSON.parse(sessionStorage.getItem('formState') || '{}');
+            ['po_input', 'current_delivery_date', 'new_delivery_date', 'delivery_notes'].forEach(id => {
+                const field = document.getElementById(id);
+                if (field) {
+                    state[id] = field.value || '';
+                }
+            });
+            sessionStorage.setItem('formState', JSON.stringify(state));
+        }
+
+        function restoreFormState() {
+            const savedState = sessionStorage.getItem('formState');
+            if (savedState) {
+                const state = JSON.parse(savedState);
+                if (document.getElementById('po_input')) document.getElementById('po_input').value = state.po_input || '';
+                if (document.getElementById('current_delivery_date')) document.getElementById('current_delivery_date').value = state.current_delivery_date || '';
+                if (document.getElementById('new_delivery_date')) document.getElementById('new_delivery_date').value = state.new_delivery_date || '';
+                if (document.getElementById('delivery_notes')) document.getElementById('delivery_notes').value = state.delivery_notes || '';
+            }
+        }
+
+        // Tab switching
+        function showTab(tabName) {
+            // Save current form state before switching
+            saveFormState();
+
+            // Hide all tab contents
+            document.querySelectorAll('.tab-content').forEach(content => {
+                content.classList.remove('active');
+            });
+
+            // Remove active class from all tabs
+            document.querySelectorAll('.tab').forEach(tab => {
+                tab.classList.remove('active');
+            });
+
+            // Show selected tab content
+            document.getElementById(tabName).classList.add('active');
+
+            // Find and activate the correct tab button
+            const tabs = document.querySelectorAll('.tab');
+            tabs.forEach((tab, index) => {
+                if ((tabName === 'artwork' && index === 0) ||
+                    (tabName === 'delivery' && index === 1) ||
+                    (tabName === 'po' && index === 2) ||
+                    (tabName === 'report' && index === 3) ||
+                    (tabName === 'settings' && index === 4)) {
+                    tab.classList.add('active');
+                }
+            });
+
+            // Tab-specific actions run once the tab's module is loaded
+            loadTabModule(tabName).then(() => {
+                if (tabName === 'delivery') {
+                    // Auto-load saved POs when delivery tab is opened
+                    loadSavedPOs();
+                    // Hide the Complete PO Details section until a PO is selected
+                    document.getElementById('delivery_info').classList.add('hidden');
+                } else if (tabName === 'artwork') {
+                    // Show welcome section if no PO has been analyzed yet
+                    if (!currentPO) {
+                        document.getElementById('welcome_section').style.display = 'block';
+                    }
+                } else if (tabName === 'report') {
+                    // Auto-load master report when report tab is opened
+                    loadMasterReport();
+                } else if (tabName === 'settings') {
+                    loadRateLimitSettings();
+                }
+
+                // Restore form state once the tab's fields exist
+                restoreFormState();
+            }).catch(() => {});
+        }
+
+        // Clear everything function for NEW button
+        function clearEverything() {
+            // Clear form inputs
+            document.getElementById('po_input').value = '';
+
+            // Re-enable PO input field
+            document.getElementById('po_input').disabled = false;
+
+            // Hide all steps except step 1
+            document.getElementById('step2').classList.add('hidden');
+            document.getElementById('step3').classList.add('hidden');
+            document.getElementById('progress_step').classList.add('hidden');
+
+            // Clear containers
+            document.getElementById('data_table_container').innerHTML = '';
+            document.getElementById('error_container').innerHTML = '';
+            document.getElementById('progress_info').innerHTML = '';
+
+            // Show welcome section
+            document.getElementById('welcome_section').style.display = 'block';
+
+            // Reset global variables
+            currentPO = null;
+            selectedMethod = 'guaranteed_complete'; // Reset to default method
+
+            // Clear session storage
+            sessionStorage.removeItem('formState');
+
+            // Re-enable and reset analyze button
+            document.getElementById('analyze_btn').disabled = false;
+            document.getElementById('analyze_btn').innerHTML = 'Analyze PO';
+
+            // Re-enable and reset download buttons
+            const downloadBtn = document.getElementById('download_btn');
+            const downloadBtnTop = document.getElementById('download_btn_top');
+            if (downloadBtn) {
+                downloadBtn.disabled = false;
+                downloadBtn.innerHTML = 'Start Download';
+            }
+            if (downloadBtnTop) {
+                downloadBtnTop.disabled = false;
+                downloadBtnTop.innerHTML = '🚀 Start Download';
+            }
+
+            // Reset method selection to default (Method 5)
+            document.querySelectorAll('.method-card').forEach(card => {
+                card.classList.remove('selected');
+            });
+            const method5Card = document.querySelector('[data-method="guaranteed_complete"]');
+            if (method5Card) {
+                method5Card.classList.add('selected');
+            }
+
+            // Clear all notifications
+            clearAllNotifications();
+
+            // Focus on PO input for immediate use
+            document.getElementById('po_input').focus();
+
+            showError('✅ Ready for new PO! Enter PO number above.', 'success');
+        }
+
+
+        // Email masking function
+        function maskEmail(email) {
+            if (!email.includes('@')) return email;
+
+            const [prefix, suffix] = email.split('@');
+
+            // Mask prefix: show first 2 characters, rest as asterisks
+            const maskedPrefix = prefix.length <= 2 ? prefix : prefix.substring(0, 2) + '*'.repeat(prefix.length - 2);
+
+            // Mask suffix: show first 1 character, rest as asterisks
+            const maskedSuffix = suffix.length <= 1 ? suffix : suffix.substring(0, 1) + '*'.repeat(suffix.length - 1);
+
+            return `${maskedPrefix}@${maskedSuffix}`;
+        }
+
+
+        function showError(message, type = 'error', persistent = false) {
+            const container = document.getElementById('error_container');
+            const className = type;
+
+            // Full-screen overlay styling
+            const overlayStyle = `
+                position: fixed;
+                top: 0;
+                left: 0;
+                width: 100vw;
+                height: 100vh;
+                background: rgba(0, 0, 0, 0.9);
+                display: flex;
+                justify-content: center;
+                align-items: center;
+                z-index: 9999;
+                backdrop-filter: blur(2px);
+            `;
+
+            // Different colors for different message types
+            let backgroundColor, textColor, borderColor;
+            switch(type) {
+                case 'success':
+                    backgroundColor = 'rgba(40, 167, 69, 0.95)';
+                    textColor = '#fff';
+                    borderColor = 'rgba(255, 255, 255, 0.3)';
+                    break;
+                case 'info':
+                    backgroundColor = 'rgba(23, 162, 184, 0.95)';
+                    textColor = '#fff';
+                    borderColor = 'rgba(255, 255, 255, 0.3)';
+                    break;
+                default: // error
+                    backgroundColor = 'rgba(220, 53, 69, 0.95)';
+                    textColor = '#fff';
+                    borderColor = 'rgba(255, 255, 255, 0.3)';
+            }
+
+            const messageStyle = `
+                background: ${backgroundColor};
+                color: ${textColor};
+                padding: 30px 50px;
+                border-radius: 15px;
+                font-size: 18px;
+                font-weight: 600;
+                text-align: center;
+                box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
+                border: 2px solid ${borderColor};
+                max-width: 80%;
+                word-wrap: break-word;
+            `;
+
+            container.innerHTML = `
+                <div class="${className}" style="${overlayStyle}">
+                    <div style="${messageStyle}">${message}</div>
+                </div>
+            `;
+
+            // Auto-hide messages after 3 seconds, unless persistent
+            if (!persistent) {
+                setTimeout(() => {
+                    container.innerHTML = '';
+                }, 3000);
+            }
+        }
+
+        // Function to clear persistent messages
+        function clearError() {
+            const container = document.getElementById('error_container');
+            container.innerHTML = '';
+        }
+
+        // Success message function
+        function showSuccess(message) {
+            showError(message, 'success', false);
+        }
+
+        // Info message function
+        function showInfo(message) {
+            showError(message, 'info', false);
+        }
+
+
+        // Drag functionality for movable modal
+        function makeDraggable(modal) {
+            const header = document.getElementById('modal_header');
+            let isDragging = false;
+            let currentX;
+            let currentY;
+            let initialX;
+            let initialY;
+            let xOffset = 0;
+            let yOffset = 0;
+
+            header.addEventListener('mousedown', dragStart);
+            document.addEventListener('mousemove', drag);
+            document.addEventListener('mouseup', dragEnd);
+
+            function dragStart(e) {
+                initialX = e.clientX - xOffset;
+                initialY = e.clientY - yOffset;
+
+                if (e.target === header || header.contains(e.target)) {
+                    isDragging = true;
+                    header.style.cursor = 'grabbing';
+                }
+            }
+
+            function drag(e) {
+                if (isDragging) {
+                    e.preventDefault();
+                    currentX = e.clientX - initialX;
+                    currentY = e.clientY - initialY;
+
+                    xOffset = currentX;
+                    yOffset = currentY;
+
+                    // Keep modal within viewport bounds
+                    const rect = modal.getBoundingClientRect();
+                    const maxX = window.innerWidth - rect.width;
+                    const maxY = window.innerHeight - rect.height;
+
+                    currentX = Math.max(0, Math.min(currentX, maxX));
+                    currentY = Math.max(0, Math.min(currentY, maxY));
+
+                    modal.style.transform = `translate(${currentX}px, ${currentY}px)`;
+                    modal.style.top = '0';
+                    modal.style.right = 'auto';
+                    modal.style.left = '0';
+                }
+            }
+
+            function dragEnd(e) {
+                initialX = currentX;
+                initialY = currentY;
+                isDragging = false;
+                header.style.cursor = 'move';
+            }
+        }
+
+        // Keyboard event handling for modal
+        document.addEventListener('keydown', function(event) {
+            const modal = document.getElementById('carton_modal');
+            if (modal && modal.style.display === 'block') {
+                if (event.key === 'Escape') {
+                    closeCartonModal();
+                } else if (event.key === 'Enter') {
+                    event.preventDefault();
+                    confirmPackItems();
+                }
+            }
+        });
@@ -0,0 +1,546 @@
+        // Download Artwork tab - ES module loaded by loadTabModule() the first time the tab opens.
+        // Shared state and helpers (currentPO, showError, ...) come from app.js.
+
+        // Checkbox handling functions
+        function selectAllItems(select) {
+            const checkboxes = document.querySelectorAll('.item-checkbox');
+            checkboxes.forEach(checkbox => {
+                checkbox.checked = select;
+            });
+            updateSelectedCount();
+        }
+
+        function updateSelectedCount() {
+            const checkboxes = document.querySelectorAll('.item-checkbox');
+            const selectedCount = document.querySelectorAll('.item-checkbox:checked').length;
+            const selectedCountElement = document.getElementById('selected_count');
+            if (selectedCountElement) {
+                selectedCountElement.textContent = selectedCount;
+            }
+        }
+
+        function getSelectedItems() {
+            const selectedItems = [];
+            const checkboxes = document.querySelectorAll('.item-checkbox:checked');
+            checkboxes.forEach(checkbox => {
+                const itemIndex = parseInt(checkbox.getAttribute('data-item-index'));
+                if (window.currentPoData && window.currentPoData.items && window.currentPoData.items[itemIndex]) {
+                    selectedItems.push(window.currentPoData.items[itemIndex]);
+                }
+            });
+            return selectedItems;
+        }
+
+        async function analyzePO() {
+            const poNumber = document.getElementById('po_input').value.trim();
+            if (!poNumber) {
+                alert('Please enter a PO number');
+                return;
+            }
+
+            // Clear previous results
+            document.getElementById('step2').classList.add('hidden');
+            document.getElementById('step3').classList.add('hidden');
+            document.getElementById('data_table_container').innerHTML = '';
+
+            // Hide welcome section when analysis starts
+            document.getElementById('welcome_section').style.display = 'none';
+
+            document.getElementById('analyze_btn').disabled = true;
+
+            // Show progress notification
+            const notificationId = `analyze-${poNumber}`;
+            showProgressNotification(notificationId, `🔍 Analyzing ${poNumber} PO data...`, 'processing', '🔄');
+
+            try {
+                const response = await fetch('/api/analyze_po?t=' + Date.now(), {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ po_number: poNumber })
+                });
+
+                const result = await response.json();
+                console.log('API Response:', result); // Debug log
+
+                if (result.success) {
+                    // Update notification to show completion
+                    updateNotification(notificationId, `✅ Finished Analyzing ${poNumber} PO`, 'success', '✅');
+
+                    currentPO = result;
+                    window.currentPoData = result;  // Store globally for checkbox functions
+                    console.log('Items received:', result.items.length); // Debug log
+                    showPOAnalysis(result);
+                    showDataTable(result.items);
+                    document.getElementById('step2').classList.remove('hidden');
+                    document.getElementById('step3').classList.remove('hidden');
+                } else {
+                    updateNotification(notificationId, `❌ Failed to analyze ${poNumber}: ${result.error || 'Unknown error'}`, 'error', '❌');
+                }
+            } catch (error) {
+                updateNotification(notificationId, `❌ Error analyzing ${poNumber}: ${error.message}`, 'error', '❌');
+            } finally {
+                document.getElementById('analyze_btn').disabled = false;
+            }
+        }
+
+        function showPOAnalysis(data) {
+            const poInfo = document.getElementById('po_info');
+            poInfo.innerHTML = `
+                <h3>${data.title}</h3>
+                <p><strong>PO Number:</strong> ${data.po_number}</p>
+                <p><strong>Total Items:</strong> ${data.total_items}</p>
+                <p><strong>Analyzed:</strong> ${data.timestamp}</p>
+            `;
+            showMethodEstimates(data.recommendations || []);
+
+            // Method cards are now static in HTML, no need to generate them dynamically
+            // Ensure Method 5 (Guaranteed Complete Download) is selected by default
+            selectedMethod = 'guaranteed_complete';
+            document.querySelectorAll('.method-card').forEach(card => {
+                card.classList.remove('selected');
+            });
+            // Select Method 5 as default
+            const method5Card = document.querySelector('[data-method="guaranteed_complete"]');
+            if (method5Card) {
+                method5Card.classList.add('selected');
+            }
+        }
+
+
+
+        function showMethodEstimates(recommendations) {
+            // Expected time to get every item on each method's cards; the list is sorted by it, fastest first
+            document.querySelectorAll('.method-eta').forEach(badge => badge.remove());
+            recommendations.forEach((rec, index) => {
+                // A method's cards include those of methods that run its engine (Standard -> Guaranteed Complete)
+                const methods = [rec.method, ...(rec.aliases || [])];
+                const onCards = selector => methods.map(method => `.method-card[data-method="${method}"] ${selector}`).join(', ');
+                // Success rate measured over recorded download runs replaces the card's static text
+                if (rec.samples > 0) {
+                    document.querySelectorAll(onCards('.success-rate')).forEach(rate => {
+                        rate.textContent = `${Math.round(rec.success_rate * 100)}% Success`;
+                        rate.title = `Measured over ${rec.samples} download run${rec.samples === 1 ? '' : 's'}`;
+                    });
+                }
+                document.querySelectorAll(onCards('.method-header')).forEach(header => {
+                    const badge = document.createElement('span');
+                    badge.className = index === 0 ? 'method-eta fastest' : 'method-eta';
+                    badge.textContent = index === 0 ? `⏱️ ~${rec.expected} · fastest` : `⏱️ ~${rec.expected}`;
+                    badge.title = rec.reason;
+                    header.appendChild(badge);
+                });
+            });
+        }
+
+        function showDataTable(items) {
+            console.log('showDataTable called with items:', items.length); // Debug log
+            const container = document.getElementById('data_table_container');
+
+            let html = `
+                <div style="margin-bottom: 15px; display: flex; align-items: center; gap: 10px; flex-wrap: wrap;">
+                    <button class="btn" onclick="selectAllItems(true)">✅ Select All</button>
+                    <button class="btn" onclick="selectAllItems(false)" style="background: #e53e3e;">❌ Deselect All</button>
+                    <span style="font-weight: bold;">Selected: <span id="selected_count">${items.length}</span> / ${items.length}</span>
+                    <button class="btn" onclick="startDownload()" id="download_btn_top" style="background: #28a745; margin-left: 20px;">🚀 Start Download</button>
+                </div>
+                <table class="data-table">
+                    <thead>
+                        <tr>
+                            <th>Select</th>
+                            <th>#</th>
+                            <th>Item #</th>
+                            <th>Description</th>
+                            <th>Quantity</th>
+                            <th>Ship To</th>
+                            <th>Need By</th>
+                            <th>Download</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+            `;
+
+            items.forEach((item, index) => {
+                html += `
+                    <tr>
+                        <td><input type="checkbox" class="item-checkbox" data-item-index="${index}" checked onchange="updateSelectedCount()"></td>
+                        <td>${index + 1}</td>
+                        <td><strong>${item.name}</strong></td>
+                        <td>${item.description}</td>
+                        <td>${item.quantity}</td>
+                        <td>${item.ship_to || 'N/A'}</td>
+                        <td>${item.need_by || 'N/A'}</td>
+                        <td>${item.has_download ? '✅' : '❌'}</td>
+                    </tr>
+                `;
+            });
+
+            html += '</tbody></table>';
+            container.innerHTML = html;
+        }
+
+        async function startDownload() {
+            if (!currentPO) {
+                showError('No PO data available. Please parse data first.');
+                return;
+            }
+
+            if (!selectedMethod) {
+                showError('Please select a download method first.');
+                return;
+            }
+
+            // Get only selected items
+            const selectedItems = getSelectedItems();
+            if (selectedItems.length === 0) {
+                showError('Please select at least one item to download.');
+                return;
+            }
+
+            // 🆕 DOWNLOAD CONFIRMATION
+            const methodName = selectedMethod === 'guaranteed_complete' ? 'Guaranteed Complete Download (Method 5)' :
+                              selectedMethod === 'original_slow' ? 'Original Slow Method' :
+                              selectedMethod === 'super_fast' ? 'Super Fast Method' :
+                              selectedMethod === 'smart_direct' ? 'Smart Direct Method' :
+                              selectedMethod === 'hybrid_smart' ? 'Hybrid Smart Method' : selectedMethod;
+
+            const confirmDownload = confirm(`🚀 Start Download Confirmation
+
+` +
+                `PO Number: ${currentPO.po_number}
+` +
+                `Method: ${methodName}
+` +
+                `Items to download: ${selectedItems.length}
+` +
+                `Expected files: ${selectedItems.length} PDFs
+
+` +
+                `Click OK to start downloading artwork files.`);
+
+            if (!confirmDownload) {
+                return;
+            }
+
+            // 🆕 PROMPT FOR PO DATABASE SAVE
+            const savePODetails = await promptSavePODetails(currentPO.po_number);
+
+            // Save current scroll position
+            const currentScrollY = window.scrollY;
+
+            // Disable both download buttons
+            const button = document.getElementById('download_btn');
+            const topButton = document.getElementById('download_btn_top');
+            if (button) {
+                button.disabled = true;
+                button.innerHTML = `⏳ Starting Download (${selectedItems.length} items)...`;
+            }
+            if (topButton) {
+                topButton.disabled = true;
+                topButton.innerHTML = `⏳ Starting Download (${selectedItems.length} items)...`;
+            }
+            document.getElementById('progress_step').classList.remove('hidden');
+
+            // Restore scroll position to prevent jumping to top
+            window.scrollTo(0, currentScrollY);
+
+            try {
+                // Save PO details to database if user chose to
+                if (savePODetails) {
+                    await savePOToDatabase(currentPO.po_number);
+                }
+
+                // Show download progress notification
+                const downloadNotificationId = `download-${currentPO.po_number}`;
+                showProgressNotification(downloadNotificationId, `📥 Downloading ${currentPO.po_number} artwork...`, 'processing', '📥');
+
+                // Start the actual download
+                await fetch('/api/start_download', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({
+                        method: selectedMethod,
+                        po_number: currentPO.po_number,
+                        items: selectedItems  // Only send selected items
+                    })
+                });
+
+                // Start polling for progress
+                pollProgress(downloadNotificationId);
+            } catch (error) {
+                const downloadNotificationId = `download-${currentPO.po_number}`;
+                updateNotification(downloadNotificationId, `❌ Error starting download for ${currentPO.po_number}: ${error.message}`, 'error', '❌');
+            }
+        }
+
+        async function pollProgress(downloadNotificationId = null) {
+            try {
+                const response = await fetch('/api/status');
+                const status = await response.json();
+
+                // Show "Open Folder" and "New PO" links if download is complete (100% and not active)
+                const showOpenFolder = !status.active && status.progress === 100 && status.download_folder;
+                const showNewPO = !status.active && status.progress === 100;
+
+                document.getElementById('progress_info').innerHTML = `
+                    <p>Progress: ${status.progress}%
+                        ${showOpenFolder ? '<a href="#" onclick="openDownloadFolder()" style="margin-left: 15px; color: #007bff; text-decoration: none; font-weight: bold;">📁 Open Folder</a>' : ''}
+                        ${showNewPO ? '<a href="#" onclick="clearEverything()" style="margin-left: 15px; color: #28a745; text-decoration: none; font-weight: bold;">🆕 New PO</a>' : ''}
+                    </p>
+                    <div style="background: #e0e0e0; height: 20px; margin: 10px 0;">
+                        <div style="background: #333; height: 100%; width: ${status.progress}%; transition: width 0.3s;"></div>
+                    </div>
+                    ${showNewPO ? '<div style="padding: 15px; background: #d4edda; border-radius: 8px; margin: 10px 0; border-left: 4px solid #28a745;"><strong>✅ Download Complete!</strong><br>📁 Open the download folder to access your files.<br>🆕 Click "NEW PO" button to start processing another PO.</div>' : ''}
+                    <div style="max-height: 200px; overflow-y: auto; background: #f9f9f9; padding: 10px; font-family: monospace;">
+                        ${status.log.slice().reverse().map(entry => `<div>${entry}</div>`).join('')}
+                    </div>
+                `;
+
+                if (status.active) {
+                    setTimeout(() => pollProgress(downloadNotificationId), 1000);
+                } else {
+                    // Download completed - update notification
+                    if (downloadNotificationId && currentPO) {
+                        if (status.progress === 100) {
+                            updateNotification(downloadNotificationId, `✅ Finished Downloading ${currentPO.po_number} artwork`, 'success', '✅');
+
+                            // 🔒 DISABLE FIELDS AFTER SUCCESSFUL DOWNLOAD
+                            // Disable PO input field
+                            document.getElementById('po_input').disabled = true;
+
+                            // Disable analyze button
+                            document.getElementById('analyze_btn').disabled = true;
+                            document.getElementById('analyze_btn').innerHTML = '✅ Completed';
+
+                            // Disable download buttons
+                            document.getElementById('download_btn').disabled = true;
+                            document.getElementById('download_btn').innerHTML = '✅ Download Complete';
+
+                            const topButton = document.getElementById('download_btn_top');
+                            if (topButton) {
+                                topButton.disabled = true;
+                                topButton.innerHTML = '✅ Download Complete';
+                            }
+
+                        } else {
+                            updateNotification(downloadNotificationId, `❌ Download failed for ${currentPO.po_number}`, 'error', '❌');
+
+                            // Re-enable buttons for retry on failure
+                            document.getElementById('download_btn').disabled = false;
+                            const topButton = document.getElementById('download_btn_top');
+                            if (topButton) {
+                                topButton.disabled = false;
+                                topButton.innerHTML = '🚀 Start Download';
+                            }
+                        }
+                    }
+                }
+            } catch (error) {
+                console.error('Error polling progress:', error);
+                if (downloadNotificationId && currentPO) {
+                    updateNotification(downloadNotificationId, `❌ Error during download of ${currentPO.po_number}`, 'error', '❌');
+                }
+            }
+        }
+
+        async function openDownloadFolder() {
+            try {
+                const response = await fetch('/api/open_folder');
+                const result = await response.json();
+                if (result.success) {
+                    showError('📁 Folder opened successfully!', 'success');
+                } else {
+                    showError('❌ ' + result.message, 'error');
+                }
+            } catch (error) {
+                showError('❌ Error opening folder: ' + error.message, 'error');
+            }
+        }
+        // PO Database functions
+        async function promptSavePODetails(poNumber) {
+            return new Promise((resolve) => {
+                const modal = document.createElement('div');
+                modal.style.cssText = `
+                    position: fixed; top: 0; left: 0; width: 100%; height: 100%;
+                    background: rgba(0,0,0,0.5); z-index: 10000; display: flex;
+                    align-items: center; justify-content: center;
+                `;
+
+                modal.innerHTML = `
+                    <div style="background: white; padding: 30px; border-radius: 10px; max-width: 500px; text-align: center;">
+                        <h3>📊 Save PO Details to Database?</h3>
+                        <p>Do you want to save complete PO details for <strong>${poNumber}</strong> to the database?</p>
+                        <p style="font-size: 0.9em; color: #666;">This will save all item details, company info, and dates for future reference.</p>
+                        <div style="margin-top: 20px;">
+                            <button id="saveYes" style="padding: 10px 20px; margin: 0 10px; background: #28a745; color: white; border: none; border-radius: 5px; cursor: pointer;">
+                                ✅ Yes, Save Details
+                            </button>
+                            <button id="saveNo" style="padding: 10px 20px; margin: 0 10px; background: #6c757d; color: white; border: none; border-radius: 5px; cursor: pointer;">
+                                ❌ No, Skip
+                            </button>
+                        </div>
+                    </div>
+                `;
+
+                document.body.appendChild(modal);
+
+                document.getElementById('saveYes').onclick = () => {
+                    document.body.removeChild(modal);
+                    resolve(true);
+                };
+
+                document.getElementById('saveNo').onclick = () => {
+                    document.body.removeChild(modal);
+                    resolve(false);
+                };
+            });
+        }
+
+        async function promptOverwritePO(poNumber) {
+            return new Promise((resolve) => {
+                const modal = document.createElement('div');
+                modal.style.cssText = `
+                    position: fixed; top: 0; left: 0; width: 100%; height: 100%;
+                    background: rgba(0,0,0,0.5); z-index: 10000; display: flex;
+                    align-items: center; justify-content: center;
+                `;
+
+                modal.innerHTML = `
+                    <div style="background: white; padding: 30px; border-radius: 10px; max-width: 500px; text-align: center;">
+                        <h3>⚠️ PO Already Exists</h3>
+                        <p>PO <strong>${poNumber}</strong> already exists in the database.</p>
+                        <p style="font-size: 0.9em; color: #666;">Do you want to overwrite the existing data?</p>
+                        <div style="margin-top: 20px;">
+                            <button id="overwriteYes" style="padding: 10px 20px; margin: 0 10px; background: #dc3545; color: white; border: none; border-radius: 5px; cursor: pointer;">
+                                🔄 Yes, Overwrite
+                            </button>
+                            <button id="overwriteNo" style="padding: 10px 20px; margin: 0 10px; background: #6c757d; color: white; border: none; border-radius: 5px; cursor: pointer;">
+                                ❌ No, Skip
+                            </button>
+                        </div>
+                    </div>
+                `;
+
+                document.body.appendChild(modal);
+
+                document.getElementById('overwriteYes').onclick = () => {
+                    document.body.removeChild(modal);
+                    resolve(true);
+                };
+
+                document.getElementById('overwriteNo').onclick = () => {
+                    document.body.removeChild(modal);
+                    resolve(false);
+                };
+            });
+        }
+
+        async function savePOToDatabase(poNumber) {
+            try {
+                // First check if PO exists
+                const checkResponse = await fetch('/api/po/check_exists', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({po_number: poNumber})
+                });
+
+                const checkResult = await checkResponse.json();
+
+                if (!checkResult.success) {
+                    showError('❌ Error checking PO existence: ' + checkResult.message, 'error');
+                    return false;
+                }
+
+                let overwrite = false;
+                if (checkResult.exists) {
+                    overwrite = await promptOverwritePO(poNumber);
+                    if (!overwrite) {
+                        showError('📊 PO database save skipped', 'info');
+                        return false;
+                    }
+                }
+
+                // Show progress notification
+                const saveNotificationId = `save-${poNumber}`;
+                showProgressNotification(saveNotificationId, `💾 Saving PO ${poNumber} details to database...`, 'processing', '💾');
+
+                // Queue the save; the server scrapes in the background and returns a job handle
+                const saveResponse = await fetch('/api/po/save_details', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({po_number: poNumber, overwrite: overwrite})
+                });
+
+                const queued = await saveResponse.json();
+                const saveResult = queued.success ? await waitForPOSaveJob(queued.status_url) : queued;
+
+                if (saveResult.success) {
+                    updateNotification(saveNotificationId, `✅ Finished Saving PO ${poNumber} to database (${saveResult.items_count} items)`, 'success', '✅');
+                    return true;
+                } else {
+                    updateNotification(saveNotificationId, `❌ Failed to save PO ${poNumber}: ${saveResult.message}`, 'error', '❌');
+                    return false;
+                }
+
+            } catch (error) {
+                showError('❌ Error saving PO to database: ' + error.message, 'error');
+                return false;
+            }
+        }
+
+        async function waitForPOSaveJob(statusUrl) {
+            // Poll the background job until the scrape-and-save finishes
+            while (true) {
+                const response = await fetch(statusUrl);
+                const result = await response.json();
+
+                if (!result.success) {
+                    return result;
+                }
+                if (result.job.status === 'completed' || result.job.status === 'failed') {
+                    return result.job.result;
+                }
+
+                await new Promise(resolve => setTimeout(resolve, 1000));
+            }
+        }
+
+        function toggleMethodSelection() {
+            const defaultDisplay = document.querySelector('.default-method-display');
+            const allMethods = document.getElementById('all_methods');
+
+            if (allMethods.style.display === 'none' || allMethods.classList.contains('hidden')) {
+                // Show all methods
+                defaultDisplay.style.display = 'none';
+                allMethods.style.display = 'block';
+                allMethods.classList.remove('hidden');
+            } else {
+                // Hide all methods, show default
+                defaultDisplay.style.display = 'block';
+                allMethods.style.display = 'none';
+                allMethods.classList.add('hidden');
+
+                // Reset selection to Method 5
+                document.querySelectorAll('.method-card').forEach(card => {
+                    card.classList.remove('selected');
+                });
+                document.querySelector('[data-method="guaranteed_complete"]').classList.add('selected');
+            }
+        }
+
+        export {
+            selectAllItems,
+            updateSelectedCount,
+            getSelectedItems,
+            analyzePO,
+            showPOAnalysis,
+            showMethodEstimates,
+            showDataTable,
+            startDownload,
+            pollProgress,
+            openDownloadFolder,
+            promptSavePODetails,
+            promptOverwritePO,
+            savePOToDatabase,
+            waitForPOSaveJob,
+            toggleMethodSelection
+        };
@@ -0,0 +1,1705 @@
+        // PO Management tab - ES module loaded by loadTabModule() the first time the tab opens.
+        // Shared state and helpers (currentPO, showError, ...) come from app.js.
+
+        // ===== SIMPLE OPTION A PACKING FUNCTIONS =====
+        let currentPOData = null;
+        let selectedItems = [];
+
+        // 1. Reset Database (One-time) + Clear All Interface
+        async function resetDatabase() {
+            const statusDiv = document.getElementById('reset_status');
+
+            if (!confirm('This will clear ALL packed status for ALL POs and reset the entire interface. Are you sure?')) {
+                return;
+            }
+
+            try {
+                statusDiv.innerHTML = '<div style="color: #007bff; padding: 10px; background: #e3f2fd; border-radius: 5px;">⏳ Resetting database...</div>';
+
+                const response = await fetch('/api/simple_packing/reset_database', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({})
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    statusDiv.innerHTML = '<div style="color: #28a745; padding: 10px; background: #d4edda; border-radius: 5px;">✅ ' + result.message + '</div>';
+
+                    // Clear ALL interface elements below reset section
+                    clearAllInterface();
+
+                } else {
+                    statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ ' + result.message + '</div>';
+                }
+
+            } catch (error) {
+                statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Error: ' + error.message + '</div>';
+            }
+        }
+
+        // Clear All Interface Elements
+        function clearAllInterface() {
+            // Clear PO input and status
+            document.getElementById('simple_po_input').value = '';
+            document.getElementById('po_load_status').innerHTML = '';
+
+            // Clear action status
+            document.getElementById('action_status').innerHTML = '';
+
+            // Clear items summary and table
+            document.getElementById('items_summary').innerHTML = '';
+            document.getElementById('items_table_body').innerHTML = '';
+
+            // Clear pack section
+            document.getElementById('selected_summary').innerHTML = '';
+            document.getElementById('pack_status').innerHTML = '';
+
+            // Hide containers
+            document.getElementById('items_container').style.display = 'none';
+            document.getElementById('pack_section').style.display = 'none';
+
+            // Reset variables
+            currentPOData = null;
+            selectedItems = [];
+
+            console.log('🔄 All interface elements cleared');
+        }
+
+        // Test Modal Function (for debugging)
+        function testModal() {
+            console.log('Test modal called');
+            const modal = document.getElementById('carton_modal');
+            console.log('Modal element found:', modal);
+
+            if (modal) {
+                // Show step 1
+                showStep1();
+
+                modal.style.display = 'block';
+                modal.style.position = 'fixed';
+                modal.style.top = '20%';
+                modal.style.right = '5%';
+                modal.style.zIndex = '10000';
+
+                // Initialize drag functionality
+                makeDraggable(modal);
+
+                // Update summary for test
+                const summary = document.getElementById('modal_selected_summary');
+                if (summary) {
+                    summary.innerHTML = 'TEST MODE - Movable window working!';
+                }
+
+                console.log('Test modal should be visible - Movable window');
+            } else {
+                alert('Modal element not found!');
+            }
+        }
+
+        // 2. Load PO
+        async function loadPOSimple() {
+            const poNumber = document.getElementById('simple_po_input').value.trim();
+            const statusDiv = document.getElementById('po_load_status');
+
+            if (!poNumber) {
+                statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Please enter a PO number</div>';
+                return;
+            }
+
+            try {
+                statusDiv.innerHTML = '<div style="color: #007bff; padding: 10px; background: #e3f2fd; border-radius: 5px;">⏳ Loading PO items...</div>';
+
+                const response = await fetch(`/api/simple_packing/load_po?po_number=${poNumber}`);
+                const result = await response.json();
+
+                if (result.success) {
+                    currentPOData = result;
+                    statusDiv.innerHTML = '<div style="color: #28a745; padding: 10px; background: #d4edda; border-radius: 5px;">✅ Loaded ' + result.total_items + ' items from PO ' + result.po_number + '</div>';
+
+                    // Show items container
+                    document.getElementById('items_container').style.display = 'block';
+                    displayItems();
+
+                    // Auto-scroll to center the items table
+                    setTimeout(() => {
+                        const itemsContainer = document.getElementById('items_container');
+                        if (itemsContainer) {
+                            itemsContainer.scrollIntoView({
+                                behavior: 'smooth',
+                                block: 'center'
+                            });
+                        }
+                    }, 300); // Small delay to ensure table is rendered
+
+                } else {
+                    statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ ' + result.message + '</div>';
+                }
+
+            } catch (error) {
+                statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Error: ' + error.message + '</div>';
+            }
+        }
+
+        // 3. Mark All Done
+        async function markAllDone() {
+            if (!currentPOData) {
+                showError('Please load a PO first');
+                return;
+            }
+
+            const statusDiv = document.getElementById('action_status');
+
+            try {
+                statusDiv.innerHTML = '<div style="color: #007bff; padding: 10px; background: #e3f2fd; border-radius: 5px;">⏳ Marking all items as done...</div>';
+
+                const response = await fetch('/api/simple_packing/mark_all_done', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({
+                        po_number: currentPOData.po_number
+                    })
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    statusDiv.innerHTML = '<div style="color: #28a745; padding: 10px; background: #d4edda; border-radius: 5px;">✅ ' + result.message + '</div>';
+
+                    // Update items status in memory
+                    currentPOData.items.forEach(item => {
+                        if (item.packed_status !== 'packed') {
+                            item.packed_status = 'done';
+                        }
+                    });
+
+                    displayItems();
+                } else {
+                    statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ ' + result.message + '</div>';
+                }
+
+            } catch (error) {
+                statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Error: ' + error.message + '</div>';
+            }
+        }
+
+        // 4. Display Items in Table Format
+        function displayItems() {
+            if (!currentPOData || !currentPOData.items) return;
+
+            const summaryDiv = document.getElementById('items_summary');
+            const tableBody = document.getElementById('items_table_body');
+
+            const totalItems = currentPOData.items.length;
+            const doneItems = currentPOData.items.filter(item => item.packed_status === 'done').length;
+            const packedItems = currentPOData.items.filter(item => item.packed_status === 'packed').length;
+
+            summaryDiv.innerHTML = `Total: ${totalItems} | Done: ${doneItems} | Packed: ${packedItems} | Remaining: ${totalItems - packedItems}`;
+
+            let html = '';
+            currentPOData.items.forEach((item, index) => {
+                const isDisabled = item.packed_status === 'packed';
+                const statusColor = item.packed_status === 'packed' ? '#28a745' :
+                                   item.packed_status === 'done' ? '#ffc107' : '#6c757d';
+                const statusText = item.packed_status === 'packed' ? 'Packed' :
+                                  item.packed_status === 'done' ? 'Done' : 'Not Packed';
+
+                const rowStyle = isDisabled ? 'opacity: 0.6; background: #f8f9fa;' : '';
+                const cartonNumber = item.carton_number || '-';
+                const cartonStyle = item.carton_number ? 'font-weight: bold; color: #007bff;' : 'color: #999;';
+
+                html += `
+                    <tr style="${rowStyle}">
+                        <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: center;">
+                            <input type="checkbox" id="item_${index}" class="item-checkbox"
+                                   ${isDisabled ? 'disabled' : ''}
+                                   onchange="updateSelections()"
+                                   style="transform: scale(1.2);">
+                        </td>
+                        <td style="padding: 12px; border-bottom: 1px solid #eee; font-weight: bold; color: #333;">
+                            ${item.item_number || 'N/A'}
+                        </td>
+                        <td style="padding: 12px; border-bottom: 1px solid #eee; color: #666;">
+                            ${item.description || 'No description'}
+                        </td>
+                        <td style="padding: 12px; border-bottom: 1px solid #eee; color: #666;">
+                            ${item.color || 'N/A'}
+                        </td>
+                        <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: center; font-weight: bold;">
+                            ${item.qty || 0}
+                        </td>
+                        <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: center;">
+                            <span style="padding: 4px 8px; border-radius: 4px; font-size: 12px; font-weight: bold; color: white; background: ${statusColor};">
+                                ${statusText}
+                            </span>
+                        </td>
+                        <td style="padding: 12px; border-bottom: 1px solid #eee; text-align: center; ${cartonStyle}">
+                            ${cartonNumber}
+                        </td>
+                    </tr>
+                `;
+            });
+
+            tableBody.innerHTML = html;
+            updateSelections();
+        }
+
+        // 5. Selection Functions
+        function selectAllPackingItems() {
+            const checkboxes = document.querySelectorAll('.item-checkbox:not([disabled])');
+            checkboxes.forEach(cb => cb.checked = true);
+            updateSelections();
+        }
+
+        function clearSelections() {
+            const checkboxes = document.querySelectorAll('.item-checkbox');
+            checkboxes.forEach(cb => cb.checked = false);
+            updateSelections();
+        }
+
+        function updateSelections() {
+            const checkboxes = document.querySelectorAll('.item-checkbox:not([disabled])');
+            selectedItems = [];
+
+            checkboxes.forEach((cb, index) => {
+                if (cb.checked) {
+                    // Find the actual item index (accounting for disabled items)
+                    const itemId = cb.id.replace('item_', '');
+                    selectedItems.push(parseInt(itemId));
+                }
+            });
+
+            if (selectedItems.length > 0) {
+                // Automatically open modal when items are selected
+                openCartonModal();
+            } else {
+                // Close modal if no items selected
+                closeCartonModal();
+            }
+        }
+
+        // 6. Two-Step Modal Functions for Carton Packing
+        function openCartonModal() {
+            console.log('openCartonModal called');
+            console.log('currentPOData:', currentPOData);
+            console.log('selectedItems:', selectedItems);
+
+            if (!currentPOData || selectedItems.length === 0) {
+                alert('Please select items to pack first!');
+                return;
+            }
+
+            // Get modal element
+            const modal = document.getElementById('carton_modal');
+            console.log('Modal element:', modal);
+
+            if (!modal) {
+                alert('Modal not found! Check HTML structure.');
+                return;
+            }
+
+            // Update modal summary
+            const modalSummary = document.getElementById('modal_selected_summary');
+            if (modalSummary) {
+                modalSummary.innerHTML = `Selected ${selectedItems.length} items for packing`;
+            }
+
+            // Reset to step 1
+            showStep1();
+
+            // Clear previous inputs
+            const cartonType = document.getElementById('modal_carton_type');
+            const cartonWeight = document.getElementById('modal_carton_weight');
+            const packStatus = document.getElementById('modal_pack_status');
+
+            if (cartonType) cartonType.value = '';
+            if (cartonWeight) cartonWeight.value = '';
+            if (packStatus) packStatus.innerHTML = '';
+
+            // Show modal as movable window (top-right)
+            modal.style.display = 'block';
+            modal.style.position = 'fixed';
+            modal.style.top = '20%';
+            modal.style.right = '5%';
+            modal.style.zIndex = '10000';
+
+            // Initialize drag functionality
+            makeDraggable(modal);
+
+            console.log('Modal should be visible now - Step 1 (movable window)');
+        }
+
+        function showStep1() {
+            document.getElementById('modal_step_1').style.display = 'block';
+            document.getElementById('modal_step_2').style.display = 'none';
+        }
+
+        function showCartonForm() {
+            console.log('Showing carton form - Step 2');
+            document.getElementById('modal_step_1').style.display = 'none';
+            document.getElementById('modal_step_2').style.display = 'block';
+
+            // Focus on carton type dropdown
+            setTimeout(() => {
+                const cartonType = document.getElementById('modal_carton_type');
+                if (cartonType) cartonType.focus();
+            }, 100);
+        }
+
+        function backToSummary() {
+            console.log('Back to summary - Step 1');
+            showStep1();
+        }
+
+        function closeCartonModal() {
+            console.log('closeCartonModal called');
+            const modal = document.getElementById('carton_modal');
+            if (modal) {
+                modal.style.display = 'none';
+                // Reset to step 1 for next time
+                showStep1();
+                console.log('Modal closed and reset to step 1');
+            } else {
+                console.log('Modal not found when trying to close');
+            }
+        }
+
+        async function confirmPackItems() {
+            const cartonType = document.getElementById('modal_carton_type').value.trim();
+            const cartonWeight = document.getElementById('modal_carton_weight').value.trim();
+            const statusDiv = document.getElementById('modal_pack_status');
+
+            // Validation
+            if (!cartonType) {
+                statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Please select carton type</div>';
+                return;
+            }
+
+            if (!cartonWeight || isNaN(cartonWeight) || parseFloat(cartonWeight) <= 0) {
+                statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Please enter valid weight</div>';
+                return;
+            }
+
+            try {
+                statusDiv.innerHTML = '<div style="color: #007bff; padding: 10px; background: #e3f2fd; border-radius: 5px;">⏳ Packing items into carton...</div>';
+
+                // Get selected items data
+                const selectedItemsData = selectedItems.map(index => ({
+                    index: index,
+                    item_number: currentPOData.items[index].item_number,
+                    description: currentPOData.items[index].description,
+                    color: currentPOData.items[index].color,
+                    qty: currentPOData.items[index].qty
+                }));
+
+                const response = await fetch('/api/simple_packing/pack_items', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({
+                        po_number: currentPOData.po_number,
+                        selected_items: selectedItemsData,
+                        carton_type: cartonType,
+                        carton_weight: parseFloat(cartonWeight)
+                    })
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    statusDiv.innerHTML = '<div style="color: #28a745; padding: 10px; background: #d4edda; border-radius: 5px;">✅ ' + result.message + '</div>';
+
+                    // Update items status in memory
+                    selectedItems.forEach(index => {
+                        currentPOData.items[index].packed_status = 'packed';
+                    });
+
+                    // Clear selections and refresh display
+                    clearSelections();
+                    displayItems();
+
+                    // Close modal after short delay
+                    setTimeout(() => {
+                        closeCartonModal();
+
+                        // Check if all items are packed
+                        checkCompletion();
+                    }, 1500);
+
+                } else {
+                    statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ ' + result.message + '</div>';
+                }
+
+            } catch (error) {
+                statusDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Error: ' + error.message + '</div>';
+            }
+        }
+
+        // 7. Check Completion
+        async function checkCompletion() {
+            if (!currentPOData) return;
+
+            try {
+                const response = await fetch(`/api/simple_packing/check_completion?po_number=${currentPOData.po_number}`);
+                const result = await response.json();
+
+                if (result.success && result.is_complete) {
+                    setTimeout(() => {
+                        showPackingList();
+                    }, 1000);
+                }
+
+            } catch (error) {
+                console.error('Error checking completion:', error);
+            }
+        }
+
+        // 8. Generate and Show Professional PDF Packing List
+        async function showPackingList() {
+            if (!currentPOData) return;
+
+            try {
+                // First get carton count for the alert
+                const response = await fetch(`/api/simple_packing/generate_packing_list?po_number=${currentPOData.po_number}`);
+                const result = await response.json();
+
+                if (result.success) {
+                    // Generate PL number and open PDF (no alert popup)
+                    const pdfUrl = `/api/simple_packing/generate_pdf_packing_list?po_number=${currentPOData.po_number}`;
+                    window.open(pdfUrl, '_blank', 'width=800,height=1000,scrollbars=yes,resizable=yes');
+                } else {
+                    alert('Error generating packing list: ' + result.message);
+                }
+
+            } catch (error) {
+                alert('Error generating packing list: ' + error.message);
+            }
+        }
+
+        // 9. Batch Packing Lists (many POs/PLs rendered on the server in parallel)
+        async function startBulkImport() {
+            const poNumbers = document.getElementById('bulk_import_input').value.split(/[\s,;]+/).filter(t => t.trim());
+            const statusDiv = document.getElementById('bulk_import_status');
+
+            if (poNumbers.length === 0) {
+                statusDiv.innerHTML = '<div style="color: #dc3545;">❌ Please enter at least one PO number</div>';
+                return;
+            }
+
+            try {
+                const response = await fetch('/api/po/bulk_import', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({
+                        po_numbers: poNumbers,
+                        overwrite: document.getElementById('bulk_import_overwrite').checked
+                    })
+                });
+                const result = await response.json();
+
+                if (!result.success) {
+                    statusDiv.innerHTML = `<div style="color: #dc3545;">❌ ${result.message}</div>`;
+                    return;
+                }
+
+                statusDiv.innerHTML = `<div style="color: #1b5e20;">⏳ Import started with ${result.workers} browsers...</div>`;
+                pollBulkImport(result.status_url);
+
+            } catch (error) {
+                statusDiv.innerHTML = `<div style="color: #dc3545;">❌ Error: ${error.message}</div>`;
+            }
+        }
+
+        async function pollBulkImport(statusUrl) {
+            const statusDiv = document.getElementById('bulk_import_status');
+            const statusIcons = {queued: '⏳', scraping: '🌐', scraped: '💾', saved: '✅', skipped: '⏭️', failed: '❌'};
+
+            try {
+                const response = await fetch(statusUrl);
+                const result = await response.json();
+
+                if (!result.success) {
+                    statusDiv.innerHTML = `<div style="color: #dc3545;">❌ ${result.message}</div>`;
+                    return;
+                }
+
+                const job = result.job;
+                const lastLog = job.log.length ? job.log[job.log.length - 1] : '';
+                const rows = Object.entries(job.po_status).map(([poNumber, entry]) =>
+                    `<tr><td style="padding: 4px 8px;">${poNumber}</td><td style="padding: 4px 8px;">${statusIcons[entry.status] || ''} ${entry.status}</td><td style="padding: 4px 8px;">${entry.message}</td></tr>`
+                ).join('');
+                const table = `<table style="margin-top: 10px; border-collapse: collapse; font-size: 13px;">${rows}</table>`;
+
+                if (job.status === 'completed') {
+                    statusDiv.innerHTML = `<div style="color: #155724;">✅ ${lastLog}</div>${table}`;
+                } else if (job.status === 'failed') {
+                    statusDiv.innerHTML = `<div style="color: #dc3545;">❌ ${job.error}</div>${table}`;
+                } else {
+                    const rate = job.pos_per_minute ? ` - ${job.pos_per_minute} POs/min` : '';
+                    statusDiv.innerHTML = `<div style="color: #1b5e20;">⏳ ${job.completed}/${job.total} (${job.progress}%)${rate}</div>${table}`;
+                    setTimeout(() => pollBulkImport(statusUrl), 2000);
+                }
+
+            } catch (error) {
+                statusDiv.innerHTML = `<div style="color: #dc3545;">❌ Error: ${error.message}</div>`;
+            }
+        }
+
+        async function startBatchPackingLists() {
+            const tokens = document.getElementById('batch_pl_input').value.split(/[\s,;]+/).filter(t => t.trim());
+            const statusDiv = document.getElementById('batch_pl_status');
+
+            if (tokens.length === 0) {
+                statusDiv.innerHTML = '<div style="color: #dc3545;">❌ Please enter at least one PO or PL number</div>';
+                return;
+            }
+
+            const plNumbers = tokens.filter(t => t.toUpperCase().startsWith('PL')).map(t => t.toUpperCase());
+            const poNumbers = tokens.filter(t => !t.toUpperCase().startsWith('PL'));
+
+            try {
+                const response = await fetch('/api/simple_packing/batch_packing_lists', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({
+                        po_numbers: poNumbers,
+                        pl_numbers: plNumbers,
+                        output: document.getElementById('batch_pl_output').value
+                    })
+                });
+                const result = await response.json();
+
+                if (!result.success) {
+                    statusDiv.innerHTML = `<div style="color: #dc3545;">❌ ${result.message}</div>`;
+                    return;
+                }
+
+                statusDiv.innerHTML = '<div style="color: #6a1b9a;">⏳ Batch started...</div>';
+                pollBatchPackingLists(result.status_url, result.download_url);
+
+            } catch (error) {
+                statusDiv.innerHTML = `<div style="color: #dc3545;">❌ Error: ${error.message}</div>`;
+            }
+        }
+
+        async function pollBatchPackingLists(statusUrl, downloadUrl) {
+            const statusDiv = document.getElementById('batch_pl_status');
+
+            try {
+                const response = await fetch(statusUrl);
+                const result = await response.json();
+                const job = result.job;
+
+                if (!result.success) {
+                    statusDiv.innerHTML = `<div style="color: #dc3545;">❌ ${result.message}</div>`;
+                    return;
+                }
+
+                const lastLog = job.log.length ? job.log[job.log.length - 1] : '';
+
+                if (job.status === 'completed') {
+                    statusDiv.innerHTML = `<div style="color: #155724;">✅ ${lastLog} (${job.pl_numbers.join(', ')})</div>`;
+                    if (job.output === 'zip') {
+                        window.location.href = downloadUrl;
+                    } else {
+                        window.open(downloadUrl, '_blank', 'width=800,height=1000,scrollbars=yes,resizable=yes');
+                    }
+                } else if (job.status === 'failed') {
+                    statusDiv.innerHTML = `<div style="color: #dc3545;">❌ ${job.error}</div>`;
+                } else {
+                    statusDiv.innerHTML = `<div style="color: #6a1b9a;">⏳ ${job.progress}% - ${lastLog}</div>`;
+                    setTimeout(() => pollBatchPackingLists(statusUrl, downloadUrl), 1000);
+                }
+
+            } catch (error) {
+                statusDiv.innerHTML = `<div style="color: #dc3545;">❌ Error: ${error.message}</div>`;
+            }
+        }
+
+
+
+        // ===== OLD COMPLEX FUNCTIONS COMMENTED OUT =====
+        /*
+        function updateWizardProgress(step) {
+            // Update wizard progress indicator
+            for (let i = 1; i <= 9; i++) {
+                const wizardStep = document.getElementById(`wizard_step_${i}`);
+                if (wizardStep) {
+                    if (i === step) {
+                        wizardStep.style.background = 'rgba(255,255,255,0.3)';
+                        wizardStep.style.fontWeight = 'bold';
+                    } else if (i < step) {
+                        wizardStep.style.background = 'rgba(40,167,69,0.3)';
+                        wizardStep.style.fontWeight = 'normal';
+                    } else {
+                        wizardStep.style.background = 'rgba(255,255,255,0.1)';
+                        wizardStep.style.fontWeight = 'normal';
+                    }
+                }
+            }
+            currentStep = step;
+        }
+
+        function loadPOForManagement() {
+            const poNumber = document.getElementById('po_management_input').value.trim();
+            const statusDiv = document.getElementById('po_management_status');
+
+            if (!poNumber) {
+                showError('Please enter a PO number');
+                return;
+            }
+
+            statusDiv.style.display = 'block';
+            statusDiv.innerHTML = '<div style="color: #007bff; padding: 15px; background: #e3f2fd; border-radius: 8px; border-left: 4px solid #2196f3;">🔍 Loading PO items...</div>';
+
+            // First debug the raw data
+            fetch('/api/po_management/debug_po', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({po_number: poNumber})
+            })
+            .then(response => response.json())
+            .then(debugData => {
+                console.log('🔍 Raw PO data from database:', debugData);
+
+                // Now load the processed data
+                return fetch('/api/po_management/get_po_items', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({po_number: poNumber})
+                });
+            })
+            .then(response => response.json())
+            .then(data => {
+                console.log('📦 Processed PO data:', data);
+                if (data.success) {
+                    currentPOData = {po_number: poNumber, items: data.items};
+                    statusDiv.innerHTML = `<div style="color: #28a745; padding: 15px; background: #d4edda; border-radius: 8px; border-left: 4px solid #28a745;">✅ Successfully loaded ${data.items.length} items!</div>`;
+                    displayPOItems(data.items);
+                    updateWizardProgress(2);
+                    setTimeout(() => goToPOStep(2), 1000);
+                } else {
+                    statusDiv.innerHTML = `<div style="color: #dc3545; padding: 15px; background: #f8d7da; border-radius: 8px; border-left: 4px solid #dc3545;">❌ ${data.message}</div>`;
+                }
+            })
+            .catch(error => {
+                statusDiv.innerHTML = `<div style="color: #dc3545;">❌ Error: ${error.message}</div>`;
+            });
+        }
+
+        function displayPOItems(items) {
+            const container = document.getElementById('po_items_container');
+
+            let html = `
+                <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
+                    <h3>PO: ${currentPOData.po_number} (${items.length} items)</h3>
+                    <div style="overflow-x: auto;">
+                        <table style="width: 100%; border-collapse: collapse; margin-top: 15px;">
+                            <thead>
+                                <tr style="background: #e9ecef;">
+                                    <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">Item #</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">Description</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">Color</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd; text-align: right;">Qty</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">Bundle Qty</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+            `;
+
+            items.forEach(item => {
+                html += `
+                    <tr>
+                        <td style="padding: 10px; border: 1px solid #ddd;">${item.item_number}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd;">${item.description}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd;">${item.color}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: right;">${item.qty}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd;">${item.bundle_qty}</td>
+                    </tr>
+                `;
+            });
+
+            html += `
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            `;
+
+            container.innerHTML = html;
+        }
+
+        function goToPOStep(stepNumber) {
+            // Hide all steps
+            document.querySelectorAll('.po-step').forEach(step => {
+                step.style.display = 'none';
+            });
+
+            // Show target step
+            document.getElementById(`po_step_${stepNumber}`).style.display = 'block';
+
+            // Update wizard progress if it's a numeric step
+            if (typeof stepNumber === 'number') {
+                updateWizardProgress(stepNumber);
+            } else if (stepNumber === '6a' || stepNumber === '6b') {
+                updateWizardProgress(6);
+            }
+        }
+
+        function goToPreviousStep() {
+            // Smart back navigation based on current completion status and packing logic
+            if (currentCompletionStatus === 'all') {
+                // All done: Skip step 4 (partial quantities)
+                if (currentPackingLogic) {
+                    goToPOStep(5); // Back to packing logic selection
+                } else {
+                    goToPOStep(3); // Back to completion status
+                }
+            } else {
+                // Partial done: Include step 4
+                if (currentPackingLogic) {
+                    goToPOStep(5); // Back to packing logic selection
+                } else {
+                    goToPOStep(4); // Back to partial quantities
+                }
+            }
+        }
+
+        function selectCompletionStatus(status) {
+            currentCompletionStatus = status;
+
+            // Save completion status to database
+            fetch('/api/po_management/save_completion_status', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({
+                    po_number: currentPOData.po_number,
+                    completion_type: status,
+                    finished_quantities: {}
+                })
+            });
+
+            if (status === 'all') {
+                // Skip partial quantities step, go directly to packing logic
+                updateWizardProgress(5);
+                goToPOStep(5);
+            } else {
+                // Show partial quantities step
+                displayPartialQuantitiesForm();
+                updateWizardProgress(4);
+                goToPOStep(4);
+            }
+        }
+
+        function displayPartialQuantitiesForm() {
+            const container = document.getElementById('partial_quantities_container');
+
+            let html = `
+                <div style="background: #fff3cd; padding: 20px; border-radius: 8px; margin: 20px 0; border: 1px solid #ffeaa7;">
+                    <h4>⚠️ Enter finished quantities (must be ≤ order quantity)</h4>
+                    <div style="overflow-x: auto; margin-top: 15px;">
+                        <table style="width: 100%; border-collapse: collapse;">
+                            <thead>
+                                <tr style="background: #f8f9fa;">
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Item #</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Description</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Order Qty</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Finished Qty</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+            `;
+
+            currentPOData.items.forEach((item, index) => {
+                html += `
+                    <tr>
+                        <td style="padding: 10px; border: 1px solid #ddd;">${item.item_number}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd;">${item.description}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: right; font-weight: bold;">${item.qty}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd;">
+                            <input type="number" id="finished_qty_${index}"
+                                   max="${item.qty}" min="0" value="${item.qty}"
+                                   style="width: 100px; padding: 5px; border: 1px solid #ddd; border-radius: 4px;"
+                                   onchange="validateFinishedQty(${index}, ${item.qty})">
+                        </td>
+                    </tr>
+                `;
+            });
+
+            html += `
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            `;
+
+            container.innerHTML = html;
+        }
+
+        function validateFinishedQty(index, maxQty) {
+            const input = document.getElementById(`finished_qty_${index}`);
+            const value = parseInt(input.value);
+
+            if (value > maxQty) {
+                input.value = maxQty;
+                showError(`Finished quantity cannot exceed order quantity (${maxQty})`);
+            }
+        }
+
+        function validatePartialQuantities() {
+            let allValid = true;
+
+            currentPOData.items.forEach((item, index) => {
+                const finishedQty = parseInt(document.getElementById(`finished_qty_${index}`).value);
+                if (finishedQty > item.qty) {
+                    allValid = false;
+                }
+                // Update item with finished quantity
+                currentPOData.items[index].finished_qty = finishedQty;
+            });
+
+            if (allValid) {
+                goToPOStep(5);
+            } else {
+                showError('Please correct the finished quantities');
+            }
+        }
+
+        function selectPackingLogic(logic) {
+            currentPackingLogic = logic;
+            updateWizardProgress(6);
+
+            if (logic === 'multi_to_one') {
+                showMultiToOnePackingInterface();
+                goToPOStep('6a');
+            } else {
+                showOneToMultiPackingInterface();
+                goToPOStep('6b');
+            }
+        }
+
+        async function showMultiToOnePackingInterface() {
+            const container = document.getElementById('multi_to_one_container');
+            const items = currentPOData.items;
+
+            // Get real-time packing status
+            const packingStatus = await getPackingStatus(currentPOData.po_number);
+
+            let html = `
+                <div style="background: #e3f2fd; padding: 20px; border-radius: 8px; margin: 20px 0; border: 1px solid #2196f3;">
+                    <h4>📦 Option A: Multi-line → 1 Carton (Real-time Packing)</h4>
+                    <p style="color: #666; margin-bottom: 15px;">Select items and they will be immediately packed into cartons. Each selection creates a new carton automatically.</p>
+                </div>
+
+                <div style="margin: 20px 0; display: flex; gap: 10px; align-items: center; flex-wrap: wrap;">
+                    <button onclick="selectAllUnpackedItems()" style="padding: 8px 16px; background: #28a745; color: white; border: none; border-radius: 5px; cursor: pointer; font-weight: bold;">
+                        ✅ Select All Unpacked
+                    </button>
+                    <button onclick="clearAllSelections()" style="padding: 8px 16px; background: #6c757d; color: white; border: none; border-radius: 5px; cursor: pointer;">
+                        ❌ Clear Selections
+                    </button>
+                    <span id="selection_counter" style="font-weight: bold; color: #007bff;">0 items selected</span>
+                </div>
+
+                <div style="margin: 20px 0;">
+                    <table style="width: 100%; border-collapse: collapse; margin: 20px 0;">
+                        <thead>
+                            <tr style="background: #f8f9fa;">
+                                <th style="padding: 12px; border: 1px solid #ddd; text-align: center;">Select</th>
+                                <th style="padding: 12px; border: 1px solid #ddd;">Item #</th>
+                                <th style="padding: 12px; border: 1px solid #ddd;">Description</th>
+                                <th style="padding: 12px; border: 1px solid #ddd;">Color</th>
+                                <th style="padding: 12px; border: 1px solid #ddd;">Qty to Pack</th>
+                                <th style="padding: 12px; border: 1px solid #ddd;">Carton #</th>
+                                <th style="padding: 12px; border: 1px solid #ddd;">Status</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+            `;
+
+            let unpackedCount = 0;
+            items.forEach((item, index) => {
+                const qtyToPack = item.finished_qty || item.qty;
+                const packingInfo = packingStatus[item.item_number];
+                const isPacked = packingInfo && packingInfo.status === 'packed';
+                const cartonNumber = isPacked ? packingInfo.carton_number : '-';
+                const statusText = isPacked ? '✅ Packed' : '⏳ Pending';
+                const statusColor = isPacked ? '#28a745' : '#ffc107';
+                const rowStyle = isPacked ? 'background: #f8fff8; opacity: 0.7;' : '';
+
+                if (!isPacked) unpackedCount++;
+
+                html += `
+                    <tr style="${rowStyle}">
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: center;">
+                            <input type="checkbox" id="select_item_${index}" onchange="handleItemSelection(${index})" ${isPacked ? 'disabled' : ''}>
+                        </td>
+                        <td style="padding: 10px; border: 1px solid #ddd; font-weight: bold;">${item.item_number}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd;">${item.description}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; color: #666;">${item.color || 'N/A'}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: right; font-weight: bold; color: #007bff;">${qtyToPack}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: center; font-weight: bold; color: ${isPacked ? '#28a745' : '#999'};">
+                            ${cartonNumber}
+                        </td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: center;">
+                            <span style="background: ${statusColor}; color: white; padding: 4px 8px; border-radius: 12px; font-size: 12px; font-weight: bold;">
+                                ${statusText}
+                            </span>
+                        </td>
+                    </tr>
+                `;
+            });
+
+            html += `
+                        </tbody>
+                    </table>
+                </div>
+
+                <div id="packing_feedback" style="margin: 20px 0;"></div>
+
+                <div style="text-align: center; margin: 30px 0;">
+                    ${unpackedCount === 0 ? `
+                        <div style="background: #d4edda; padding: 20px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #28a745;">
+                            <h4 style="color: #155724; margin: 0 0 10px 0;">🎉 All Items Packed!</h4>
+                            <p style="color: #155724; margin: 0;">All items have been packed into cartons. You can now proceed to the next step.</p>
+                        </div>
+                        <button onclick="goToPOStep(7)" style="padding: 12px 24px; background: #28a745; color: white; border: none; border-radius: 8px; cursor: pointer; font-size: 16px; font-weight: bold;">
+                            ➡️ Continue to Carton Summary
+                        </button>
+                    ` : `
+                        <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #ffc107;">
+                            <p style="color: #856404; margin: 0;"><strong>${unpackedCount} items</strong> remaining to pack. Select items above to pack them automatically.</p>
+                        </div>
+                    `}
+                </div>
+            `;
+
+            container.innerHTML = html;
+            updateSelectionCounter();
+        }
+
+        function showOneToMultiPackingInterface() {
+            const container = document.getElementById('one_to_multi_container');
+            const items = currentPOData.items;
+
+            let html = `
+                <div style="background: #f3e5f5; padding: 20px; border-radius: 8px; margin: 20px 0; border: 1px solid #9c27b0;">
+                    <h4>📦📦📦 Select one item to split across multiple cartons</h4>
+                    <p style="color: #666; margin-bottom: 15px;">Choose one item and specify how many cartons to split it into.</p>
+
+                    <div style="margin-bottom: 20px;">
+                        <label style="display: block; margin-bottom: 10px; font-weight: bold;">Select Item:</label>
+                        <select id="item_to_split" onchange="updateOneToMultiInterface()" style="width: 100%; padding: 10px; border: 1px solid #ddd; border-radius: 4px; font-size: 16px;">
+                            <option value="">Choose an item to split</option>
+            `;
+
+            items.forEach((item, index) => {
+                const qtyToPack = item.finished_qty || item.qty;
+                html += `<option value="${index}">${item.item_number} - ${item.description} (${qtyToPack} pcs)</option>`;
+            });
+
+            html += `
+                        </select>
+                    </div>
+
+                    <div id="split_details" style="display: none;">
+                        <div style="margin-bottom: 15px;">
+                            <label style="display: block; margin-bottom: 5px; font-weight: bold;">Number of Cartons:</label>
+                            <input type="number" id="carton_count" min="2" max="10" onchange="calculateSplitQuantities()"
+                                   style="width: 150px; padding: 8px; border: 1px solid #ddd; border-radius: 4px;">
+                        </div>
+
+                        <div style="margin-bottom: 15px;">
+                            <label style="display: block; margin-bottom: 5px; font-weight: bold;">Quantity per Carton:</label>
+                            <input type="number" id="qty_per_carton" onchange="updateLastCartonQty()"
+                                   style="width: 150px; padding: 8px; border: 1px solid #ddd; border-radius: 4px;">
+                            <small style="color: #666; margin-left: 10px;">Last carton will get the remainder</small>
+                        </div>
+
+                        <div id="carton_breakdown" style="margin: 15px 0; padding: 15px; background: #fff; border-radius: 4px; border: 1px solid #ddd;">
+                            <!-- Carton breakdown will be shown here -->
+                        </div>
+
+                        <div style="margin-top: 20px; text-align: center;">
+                            <button onclick="goToPOStep(5)" style="padding: 12px 24px; background: #6c757d; color: white; border: none; border-radius: 8px; cursor: pointer; font-size: 16px; margin-right: 10px;">
+                                ← Back to Packing Logic
+                            </button>
+                            <button onclick="createOneToMultiCartons()" style="padding: 12px 24px; background: #28a745; color: white; border: none; border-radius: 8px; cursor: pointer; font-size: 16px;">
+                                📦 Create Cartons →
+                            </button>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            container.innerHTML = html;
+        }
+
+        // New real-time packing helper functions
+        async function getPackingStatus(poNumber) {
+            try {
+                const response = await fetch(`/api/po_management/get_packing_status?po_number=${poNumber}`);
+                const result = await response.json();
+                return result.success ? result.packed_items : {};
+            } catch (error) {
+                console.error('Error getting packing status:', error);
+                return {};
+            }
+        }
+
+        function updateSelectionCounter() {
+            const checkboxes = document.querySelectorAll('[id^="select_item_"]:not([disabled])');
+            let selectedCount = 0;
+            checkboxes.forEach(cb => {
+                if (cb.checked) selectedCount++;
+            });
+
+            const counter = document.getElementById('selection_counter');
+            if (counter) {
+                counter.textContent = `${selectedCount} items selected`;
+                counter.style.color = selectedCount > 0 ? '#28a745' : '#007bff';
+            }
+        }
+
+        function selectAllUnpackedItems() {
+            const checkboxes = document.querySelectorAll('[id^="select_item_"]:not([disabled])');
+            checkboxes.forEach(cb => {
+                cb.checked = true;
+            });
+            updateSelectionCounter();
+        }
+
+        function clearAllSelections() {
+            const checkboxes = document.querySelectorAll('[id^="select_item_"]');
+            checkboxes.forEach(cb => {
+                cb.checked = false;
+            });
+            updateSelectionCounter();
+        }
+
+        async function handleItemSelection(index) {
+            const checkbox = document.getElementById(`select_item_${index}`);
+
+            if (checkbox.checked) {
+                // Item was selected - pack it immediately
+                await packSelectedItems([index]);
+                checkbox.checked = false; // Uncheck after packing
+            }
+
+            updateSelectionCounter();
+        }
+
+        async function packSelectedItems(selectedIndices) {
+            const feedbackDiv = document.getElementById('packing_feedback');
+
+            try {
+                feedbackDiv.innerHTML = '<div style="color: #007bff; padding: 10px; background: #e3f2fd; border-radius: 5px;">⏳ Packing items...</div>';
+
+                const selectedItems = selectedIndices.map(index => {
+                    const item = currentPOData.items[index];
+                    return {
+                        item_number: item.item_number,
+                        description: item.description,
+                        color: item.color || '',
+                        packed_qty: item.finished_qty || item.qty,
+                        original_qty: item.qty
+                    };
+                });
+
+                const response = await fetch('/api/po_management/pack_items_realtime', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({
+                        po_number: currentPOData.po_number,
+                        selected_items: selectedItems
+                    })
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    feedbackDiv.innerHTML = `<div style="color: #28a745; padding: 10px; background: #d4edda; border-radius: 5px;">✅ Packed ${result.packed_items} items into ${result.carton_number}</div>`;
+
+                    // Refresh the interface to show updated status
+                    setTimeout(() => {
+                        showMultiToOnePackingInterface();
+                    }, 1500);
+                } else {
+                    feedbackDiv.innerHTML = `<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ ${result.message}</div>`;
+                }
+
+            } catch (error) {
+                feedbackDiv.innerHTML = `<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Error packing items: ${error.message}</div>`;
+            }
+        }
+
+        function updateOneToMultiInterface() {
+            const select = document.getElementById('item_to_split');
+            const detailsDiv = document.getElementById('split_details');
+
+            if (select.value) {
+                detailsDiv.style.display = 'block';
+                const item = currentPOData.items[parseInt(select.value)];
+                const qtyToPack = item.finished_qty || item.qty;
+                document.getElementById('qty_per_carton').max = qtyToPack;
+            } else {
+                detailsDiv.style.display = 'none';
+            }
+        }
+
+        function calculateSplitQuantities() {
+            const itemIndex = parseInt(document.getElementById('item_to_split').value);
+            const cartonCount = parseInt(document.getElementById('carton_count').value);
+
+            if (itemIndex >= 0 && cartonCount > 1) {
+                const item = currentPOData.items[itemIndex];
+                const totalQty = item.finished_qty || item.qty;
+                const qtyPerCarton = Math.floor(totalQty / cartonCount);
+
+                document.getElementById('qty_per_carton').value = qtyPerCarton;
+                updateLastCartonQty();
+            }
+        }
+
+        function updateLastCartonQty() {
+            const itemIndex = parseInt(document.getElementById('item_to_split').value);
+            const cartonCount = parseInt(document.getElementById('carton_count').value);
+            const qtyPerCarton = parseInt(document.getElementById('qty_per_carton').value);
+
+            if (itemIndex >= 0 && cartonCount > 1 && qtyPerCarton > 0) {
+                const item = currentPOData.items[itemIndex];
+                const totalQty = item.finished_qty || item.qty;
+                const lastCartonQty = totalQty - (qtyPerCarton * (cartonCount - 1));
+
+                let html = `<h5>Carton Breakdown:</h5>`;
+                for (let i = 1; i < cartonCount; i++) {
+                    html += `<div>Carton ${i}: ${qtyPerCarton} pcs</div>`;
+                }
+                html += `<div style="font-weight: bold; color: #007bff;">Carton ${cartonCount}: ${lastCartonQty} pcs (remainder)</div>`;
+                html += `<div style="margin-top: 10px; font-weight: bold;">Total: ${totalQty} pcs</div>`;
+
+                document.getElementById('carton_breakdown').innerHTML = html;
+            }
+        }
+
+        // Enhanced carton creation functions
+
+        function createMultiToOneCarton() {
+            console.log('🔧 Creating multi-to-one carton...');
+
+            // Prevent multiple clicks
+            const button = event.target;
+            if (button.disabled) return;
+            button.disabled = true;
+            button.innerHTML = '⏳ Creating...';
+
+            const feedbackDiv = document.getElementById('multi_to_one_feedback');
+            feedbackDiv.innerHTML = '<div style="color: #007bff; padding: 10px; background: #e3f2fd; border-radius: 5px;">⏳ Creating carton...</div>';
+
+            const checkboxes = document.querySelectorAll('[id^="select_item_"]:not([disabled])');
+            const weight = parseFloat(document.getElementById('carton_weight').value);
+            const cartonSize = document.getElementById('carton_size_select').value;
+
+            console.log('📦 Found checkboxes:', checkboxes.length);
+            console.log('⚖️ Weight:', weight);
+            console.log('📏 Size:', cartonSize);
+
+            if (!weight || weight <= 0) {
+                feedbackDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Please enter a valid carton weight</div>';
+                button.disabled = false;
+                button.innerHTML = '📦 Create Carton';
+                return;
+            }
+
+            let selectedItems = [];
+            checkboxes.forEach((cb, index) => {
+                if (cb.checked) {
+                    const item = currentPOData.items[index];
+                    selectedItems.push({
+                        item_number: item.item_number,
+                        description: item.description,
+                        color: item.color || '',
+                        packed_qty: item.finished_qty || item.qty,
+                        original_qty: item.qty
+                    });
+                    console.log('✅ Selected item:', item.item_number, 'qty:', item.finished_qty || item.qty);
+                }
+            });
+
+            console.log('📋 Selected items:', selectedItems);
+
+            if (selectedItems.length === 0) {
+                feedbackDiv.innerHTML = '<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Please select at least one item to pack</div>';
+                button.disabled = false;
+                button.innerHTML = '📦 Create Carton';
+                return;
+            }
+
+            // Create carton data with enhanced tracking
+            const cartonData = {
+                size: cartonSize,
+                weight: weight,
+                items: selectedItems
+            };
+
+            console.log('📦 Carton data to send:', cartonData);
+
+            // Call API to create carton with enhanced tracking
+            fetch('/api/po_management/create_cartons', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({
+                    po_number: currentPOData.po_number,
+                    cartons: [cartonData],
+                    packing_option: 'A'
+                })
+            })
+            .then(response => {
+                console.log('🌐 API Response status:', response.status);
+                return response.json();
+            })
+            .then(data => {
+                console.log('📊 API Response data:', data);
+                if (data.success) {
+                    createdCartons.push(...data.cartons);
+                    feedbackDiv.innerHTML = `<div style="color: #28a745; padding: 15px; background: #d4edda; border-radius: 5px; border-left: 4px solid #28a745;">✅ Carton created successfully!<br><strong>Barcode:</strong> ${data.cartons[0].barcode}<br><strong>Items packed:</strong> ${selectedItems.length}</div>`;
+
+                    // Clear selections and refresh interface
+                    checkboxes.forEach(cb => {
+                        if (cb.checked) cb.checked = false;
+                    });
+                    document.getElementById('carton_weight').value = '';
+
+                    // Refresh the interface to show packed status
+                    setTimeout(() => {
+                        showMultiToOnePackingInterface();
+                        feedbackDiv.innerHTML = `<div style="color: #28a745; padding: 10px; background: #d4edda; border-radius: 5px;">✅ Ready to pack more items</div>`;
+                    }, 2000);
+
+                } else {
+                    feedbackDiv.innerHTML = `<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ ${data.message}</div>`;
+                }
+                button.disabled = false;
+                button.innerHTML = '📦 Create Carton';
+            })
+            .catch(error => {
+                console.error('❌ Error creating carton:', error);
+                feedbackDiv.innerHTML = `<div style="color: #dc3545; padding: 10px; background: #f8d7da; border-radius: 5px;">❌ Error creating carton: ${error.message}</div>`;
+                button.disabled = false;
+                button.innerHTML = '📦 Create Carton';
+            });
+        }
+
+        function createOneToMultiCartons() {
+            const itemIndex = parseInt(document.getElementById('item_to_split').value);
+            const cartonCount = parseInt(document.getElementById('carton_count').value);
+            const qtyPerCarton = parseInt(document.getElementById('qty_per_carton').value);
+
+            if (itemIndex < 0 || cartonCount < 2 || qtyPerCarton <= 0) {
+                showError('Please fill in all required fields correctly');
+                return;
+            }
+
+            const item = currentPOData.items[itemIndex];
+            const totalQty = item.finished_qty || item.qty;
+            const lastCartonQty = totalQty - (qtyPerCarton * (cartonCount - 1));
+
+            if (lastCartonQty <= 0) {
+                showError('Invalid quantity distribution. Please adjust quantities.');
+                return;
+            }
+
+            // Create multiple cartons
+            let cartonsData = [];
+            for (let i = 1; i <= cartonCount; i++) {
+                const qty = (i === cartonCount) ? lastCartonQty : qtyPerCarton;
+                cartonsData.push({
+                    size: 'Standard',
+                    weight: 0, // Will be updated later
+                    items: [{
+                        item_number: item.item_number,
+                        description: item.description,
+                        color: item.color || '',
+                        packed_qty: qty,
+                        original_qty: item.qty
+                    }]
+                });
+            }
+
+            // Call API to create cartons with enhanced tracking
+            fetch('/api/po_management/create_cartons', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({
+                    po_number: currentPOData.po_number,
+                    cartons: cartonsData,
+                    packing_option: 'B'
+                })
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    createdCartons.push(...data.cartons);
+                    showSuccess(`✅ ${cartonCount} cartons created successfully!`);
+                    displayCartonSummary();
+                    updateWizardProgress(7);
+                    goToPOStep(7);
+                } else {
+                    showError(`❌ ${data.message}`);
+                }
+            })
+            .catch(error => {
+                showError(`❌ Error creating cartons: ${error.message}`);
+            });
+        }
+
+        function displayCartonSummary() {
+            const container = document.getElementById('carton_summary_container');
+
+            let html = `
+                <div style="background: #d4edda; padding: 25px; border-radius: 12px; margin: 20px 0; border: 1px solid #28a745; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+                    <h4 style="color: #155724; margin-bottom: 15px;">📦 Carton Summary & Barcodes</h4>
+                    <div style="display: flex; gap: 20px; margin-bottom: 20px; flex-wrap: wrap;">
+                        <div style="background: white; padding: 15px; border-radius: 8px; flex: 1; min-width: 200px;">
+                            <strong>Total Cartons:</strong> ${createdCartons.length}
+                        </div>
+                        <div style="background: white; padding: 15px; border-radius: 8px; flex: 1; min-width: 200px;">
+                            <strong>PO Number:</strong> ${currentPOData.po_number}
+                        </div>
+                        <div style="background: white; padding: 15px; border-radius: 8px; flex: 1; min-width: 200px;">
+                            <strong>Packing Option:</strong> ${currentPackingLogic === 'multi_to_one' ? 'Option A' : 'Option B'}
+                        </div>
+                    </div>
+
+                    <div style="overflow-x: auto; margin-top: 15px;">
+                        <table style="width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden;">
+                            <thead>
+                                <tr style="background: #28a745; color: white;">
+                                    <th style="padding: 12px; border: 1px solid #ddd;">Carton #</th>
+                                    <th style="padding: 12px; border: 1px solid #ddd;">Barcode</th>
+                                    <th style="padding: 12px; border: 1px solid #ddd;">Weight (kg)</th>
+                                    <th style="padding: 12px; border: 1px solid #ddd;">Items</th>
+                                    <th style="padding: 12px; border: 1px solid #ddd;">Total Qty</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+            `;
+
+            createdCartons.forEach(carton => {
+                const totalQty = carton.items.reduce((sum, item) => sum + item.packed_qty, 0);
+                const itemsList = carton.items.map(item => `${item.item_number} (${item.packed_qty})`).join(', ');
+
+                html += `
+                    <tr style="border-bottom: 1px solid #ddd;">
+                        <td style="padding: 12px; border: 1px solid #ddd; font-weight: bold; color: #007bff;">${carton.carton_number}</td>
+                        <td style="padding: 12px; border: 1px solid #ddd; font-family: monospace; font-size: 11px; background: #f8f9fa;">${carton.barcode}</td>
+                        <td style="padding: 12px; border: 1px solid #ddd; text-align: center; font-weight: bold;">${carton.weight || 0}</td>
+                        <td style="padding: 12px; border: 1px solid #ddd; font-size: 13px;">${itemsList}</td>
+                        <td style="padding: 12px; border: 1px solid #ddd; text-align: right; font-weight: bold; color: #28a745;">${totalQty}</td>
+                    </tr>
+                `;
+            });
+
+            html += `
+                            </tbody>
+                        </table>
+                    </div>
+                </div>
+            `;
+
+            container.innerHTML = html;
+        }
+
+        function generateBarcodes() {
+            showSuccess('🏷️ Barcodes generated! (Feature: Print barcode labels)');
+        }
+
+        function createShipment() {
+            const courier = document.getElementById('courier_select').value;
+            const awbNumber = document.getElementById('awb_input').value.trim();
+
+            if (!courier || !awbNumber) {
+                showError('Please select courier and enter AWB number');
+                return;
+            }
+
+            updateWizardProgress(8);
+            showInfo('🚚 Creating shipment...');
+
+            const cartonIds = createdCartons.map(carton => carton.id);
+
+            fetch('/api/po_management/create_shipment', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({
+                    po_number: currentPOData.po_number,
+                    courier: courier,
+                    awb_number: awbNumber,
+                    carton_ids: cartonIds
+                })
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    showSuccess(`🚚 Shipment created successfully! Total: ${data.total_cartons} cartons, ${data.total_weight}kg`);
+                    displayFinalSummary(courier, awbNumber, data);
+                    updateWizardProgress(9);
+                    goToPOStep(9);
+                } else {
+                    showError(`❌ ${data.message}`);
+                }
+            })
+            .catch(error => {
+                showError(`❌ Error creating shipment: ${error.message}`);
+            });
+        }
+
+        function displayFinalSummary(courier, awbNumber, shipmentData) {
+            const container = document.getElementById('final_summary_container');
+            const totalItems = createdCartons.reduce((sum, carton) =>
+                sum + carton.items.reduce((itemSum, item) => itemSum + item.packed_qty, 0), 0);
+            const totalWeight = shipmentData ? shipmentData.total_weight : 0;
+
+            let html = `
+                <div style="background: linear-gradient(135deg, #d1ecf1 0%, #e8f5e8 100%); padding: 30px; border-radius: 15px; margin: 20px 0; border: 2px solid #17a2b8; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">
+                    <div style="text-align: center; margin-bottom: 25px;">
+                        <h3 style="color: #0c5460; margin: 0;">🎉 Packing List Complete!</h3>
+                        <p style="color: #0c5460; margin: 5px 0; font-size: 16px;">All items packed and ready for shipment</p>
+                    </div>
+
+                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 25px 0;">
+                        <div style="background: white; padding: 20px; border-radius: 10px; border-left: 4px solid #007bff;">
+                            <h5 style="color: #007bff; margin-bottom: 15px;">📋 PO Summary</h5>
+                            <p><strong>PO Number:</strong> ${currentPOData.po_number}</p>
+                            <p><strong>Total Items:</strong> ${totalItems} pieces</p>
+                            <p><strong>Completion:</strong> ${currentCompletionStatus === 'all' ? 'Complete' : 'Partial'}</p>
+                            <p><strong>Packing Method:</strong> ${currentPackingLogic === 'multi_to_one' ? 'Option A (Multi→1)' : 'Option B (1→Multi)'}</p>
+                        </div>
+                        <div style="background: white; padding: 20px; border-radius: 10px; border-left: 4px solid #28a745;">
+                            <h5 style="color: #28a745; margin-bottom: 15px;">📦 Carton Summary</h5>
+                            <p><strong>Total Cartons:</strong> ${createdCartons.length}</p>
+                            <p><strong>Total Weight:</strong> ${totalWeight}kg</p>
+                            <p><strong>Barcodes:</strong> Generated</p>
+                            <p><strong>Status:</strong> Ready to Ship</p>
+                        </div>
+                        <div style="background: white; padding: 20px; border-radius: 10px; border-left: 4px solid #ffc107;">
+                            <h5 style="color: #856404; margin-bottom: 15px;">🚚 Shipment Details</h5>
+                            <p><strong>Courier:</strong> ${courier}</p>
+                            <p><strong>AWB Number:</strong> ${awbNumber}</p>
+                            <p><strong>Ship Date:</strong> ${new Date().toLocaleDateString()}</p>
+                            <p><strong>Status:</strong> Confirmed</p>
+                        </div>
+                    </div>
+
+                    <div style="text-align: center; margin-top: 25px; padding: 20px; background: rgba(255,255,255,0.7); border-radius: 10px;">
+                        <p style="color: #0c5460; font-size: 14px; margin: 0;">
+                            ✅ All steps completed successfully! Your packing list is ready for download.
+                        </p>
+                    </div>
+                </div>
+            `;
+
+            container.innerHTML = html;
+        }
+
+        function downloadPackingList() {
+            showInfo('📄 Generating packing list...');
+
+            fetch('/api/po_management/generate_packing_list', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({
+                    po_number: currentPOData.po_number
+                })
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    // Create downloadable content
+                    const packingListContent = generatePackingListHTML(data.packing_list);
+                    const blob = new Blob([packingListContent], { type: 'text/html' });
+                    const url = window.URL.createObjectURL(blob);
+                    const a = document.createElement('a');
+                    a.href = url;
+                    a.download = `PackingList_${currentPOData.po_number}_${new Date().toISOString().split('T')[0]}.html`;
+                    document.body.appendChild(a);
+                    a.click();
+                    document.body.removeChild(a);
+                    window.URL.revokeObjectURL(url);
+                    showSuccess('📄 Packing list downloaded successfully!');
+                } else {
+                    showError(`❌ ${data.message}`);
+                }
+            })
+            .catch(error => {
+                showError(`❌ Error generating packing list: ${error.message}`);
+            });
+        }
+
+        function generatePackingListHTML(packingList) {
+            return `
+                <!DOCTYPE html>
+                <html>
+                <head>
+                    <title>Packing List - PO ${packingList.po_number}</title>
+                    <style>
+                        body { font-family: Arial, sans-serif; margin: 20px; }
+                        .header { text-align: center; margin-bottom: 30px; }
+                        .summary { display: flex; gap: 20px; margin-bottom: 30px; }
+                        .summary div { flex: 1; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }
+                        table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
+                        th, td { padding: 8px; border: 1px solid #ddd; text-align: left; }
+                        th { background: #f5f5f5; }
+                        .barcode { font-family: monospace; font-size: 12px; }
+                    </style>
+                </head>
+                <body>
+                    <div class="header">
+                        <h1>PACKING LIST</h1>
+                        <h2>PO Number: ${packingList.po_number}</h2>
+                        <p>Generated: ${packingList.generated_at}</p>
+                    </div>
+
+                    <div class="summary">
+                        <div>
+                            <h3>Shipment Details</h3>
+                            <p><strong>Courier:</strong> ${packingList.shipment ? packingList.shipment[0] : 'N/A'}</p>
+                            <p><strong>AWB:</strong> ${packingList.shipment ? packingList.shipment[1] : 'N/A'}</p>
+                            <p><strong>Total Cartons:</strong> ${packingList.shipment ? packingList.shipment[3] : 'N/A'}</p>
+                            <p><strong>Total Weight:</strong> ${packingList.shipment ? packingList.shipment[4] : 'N/A'}kg</p>
+                        </div>
+                    </div>
+
+                    <h3>Carton Details</h3>
+                    <table>
+                        <thead>
+                            <tr>
+                                <th>Carton #</th>
+                                <th>Barcode</th>
+                                <th>Weight</th>
+                                <th>Item #</th>
+                                <th>Description</th>
+                                <th>Color</th>
+                                <th>Qty</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            ${packingList.packing_data.map(row => `
+                                <tr>
+                                    <td>${row[0]}</td>
+                                    <td class="barcode">${row[1]}</td>
+                                    <td>${row[2]}kg</td>
+                                    <td>${row[4]}</td>
+                                    <td>${row[5]}</td>
+                                    <td>${row[6]}</td>
+                                    <td>${row[7]}</td>
+                                </tr>
+                            `).join('')}
+                        </tbody>
+                    </table>
+                </body>
+                </html>
+            `;
+        }
+
+        function viewCreatedCartons() {
+            if (createdCartons.length === 0) {
+                showInfo('📦 No cartons created yet. Create some cartons first!');
+                return;
+            }
+
+            const feedbackDiv = document.getElementById('multi_to_one_feedback');
+            let html = `
+                <div style="background: #e8f5e8; padding: 20px; border-radius: 8px; margin: 20px 0; border: 1px solid #28a745;">
+                    <h4 style="color: #155724; margin-bottom: 15px;">📦 Created Cartons (${createdCartons.length})</h4>
+                    <div style="overflow-x: auto;">
+                        <table style="width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden;">
+                            <thead>
+                                <tr style="background: #28a745; color: white;">
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Carton #</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Barcode</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Size</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Weight</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Items</th>
+                                    <th style="padding: 10px; border: 1px solid #ddd;">Total Qty</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+            `;
+
+            createdCartons.forEach(carton => {
+                const totalQty = carton.items.reduce((sum, item) => sum + item.packed_qty, 0);
+                const itemsList = carton.items.map(item => `${item.item_number} (${item.packed_qty})`).join(', ');
+
+                html += `
+                    <tr style="border-bottom: 1px solid #ddd;">
+                        <td style="padding: 10px; border: 1px solid #ddd; font-weight: bold; color: #007bff;">${carton.carton_number}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; font-family: monospace; font-size: 11px; background: #f8f9fa;">${carton.barcode}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: center;">${carton.size || 'Standard'}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: center; font-weight: bold;">${carton.weight || 0}kg</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; font-size: 12px;">${itemsList}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; text-align: right; font-weight: bold; color: #28a745;">${totalQty}</td>
+                    </tr>
+                `;
+            });
+
+            html += `
+                            </tbody>
+                        </table>
+                    </div>
+                    <div style="margin-top: 15px; text-align: center;">
+                        <button onclick="showMultiToOnePackingInterface()" style="padding: 10px 20px; background: #007bff; color: white; border: none; border-radius: 5px; cursor: pointer;">
+                            ← Back to Packing
+                        </button>
+                    </div>
+                </div>
+            `;
+
+            feedbackDiv.innerHTML = html;
+        }
+
+        function resetPOManagement() {
+            // Reset all variables
+            currentPOData = null;
+            currentCompletionStatus = null;
+            currentPackingLogic = null;
+            createdCartons = [];
+            currentStep = 1;
+
+            // Clear all inputs
+            document.getElementById('po_management_input').value = '';
+            document.getElementById('po_management_status').style.display = 'none';
+
+            // Reset wizard progress
+            updateWizardProgress(1);
+
+            // Go back to step 1
+            goToPOStep(1);
+            showSuccess('🔄 Ready for new PO management - All data cleared');
+        }
+        */
+        // ===== END OF OLD COMPLEX FUNCTIONS =====
+
+        export {
+            resetDatabase,
+            clearAllInterface,
+            testModal,
+            loadPOSimple,
+            markAllDone,
+            displayItems,
+            selectAllPackingItems,
+            clearSelections,
+            updateSelections,
+            openCartonModal,
+            showStep1,
+            showCartonForm,
+            backToSummary,
+            closeCartonModal,
+            confirmPackItems,
+            checkCompletion,
+            showPackingList,
+            startBulkImport,
+            pollBulkImport,
+            startBatchPackingLists,
+            pollBatchPackingLists
+        };
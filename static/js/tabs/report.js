@@ -0,0 +1,384 @@
+        // Report tab - ES module loaded by loadTabModule() the first time the tab opens.
+        // Shared state and helpers (currentPO, showError, ...) come from app.js.
+
+        // Report Functions
+        async function generateReport() {
+            const fromDate = document.getElementById('report_date_from').value;
+            const toDate = document.getElementById('report_date_to').value;
+
+            if (!fromDate || !toDate) {
+                alert('Please select both from and to dates');
+                return;
+            }
+
+            // Simulate report generation
+            const reportHtml = `
+                <table class="data-table">
+                    <thead>
+                        <tr>
+                            <th>Date</th>
+                            <th>PO Number</th>
+                            <th>Items Downloaded</th>
+                            <th>Status</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr>
+                            <td>2025-08-01</td>
+                            <td>1284789</td>
+                            <td>3</td>
+                            <td>✅ Complete</td>
+                        </tr>
+                        <tr>
+                            <td>2025-07-31</td>
+                            <td>1288060</td>
+                            <td>5</td>
+                            <td>✅ Complete</td>
+                        </tr>
+                    </tbody>
+                </table>
+            `;
+
+            document.getElementById('report_table_container').innerHTML = reportHtml;
+            document.getElementById('report_results').classList.remove('hidden');
+
+            // Update quick stats
+            document.getElementById('today_downloads').textContent = '3';
+            document.getElementById('week_downloads').textContent = '8';
+            document.getElementById('total_files').textContent = '156';
+        }
+
+        async function exportReport() {
+            alert('Report exported to CSV (feature coming soon)');
+        }
+
+        // Master Report Functions
+        let masterReportData = [];
+        let masterReportNextCursor = null;
+        let masterReportSort = '';
+        let searchTimeout = null;
+
+        function loadMasterReport() {
+            console.log('🔍 Loading master report...');
+
+            // Show loading state
+            document.getElementById('master_report_loading').style.display = 'block';
+            document.getElementById('master_report_container').style.display = 'none';
+            document.getElementById('master_report_empty').style.display = 'none';
+
+            fetch(`/api/master_report?${getMasterReportSearchParams().toString()}`)
+                .then(response => response.json())
+                .then(decodeMasterReportResponse)
+                .then(data => {
+                    console.log('📊 Master report data received:', data);
+
+                    if (data.success && data.data.length > 0) {
+                        masterReportData = data.data;
+                        masterReportNextCursor = data.next_cursor;
+                        displayMasterReportData(data.data);
+                        updateMasterReportStats(data);
+
+                        // Show table
+                        document.getElementById('master_report_loading').style.display = 'none';
+                        document.getElementById('master_report_container').style.display = 'block';
+                    } else {
+                        // Show empty state
+                        document.getElementById('master_report_loading').style.display = 'none';
+                        document.getElementById('master_report_empty').style.display = 'block';
+                    }
+                })
+                .catch(error => {
+                    console.error('❌ Error loading master report:', error);
+                    showError('Failed to load master report: ' + error.message);
+                    document.getElementById('master_report_loading').style.display = 'none';
+                    document.getElementById('master_report_empty').style.display = 'block';
+                });
+        }
+
+        function decodeMasterReportResponse(data) {
+            // Columnar responses carry item columns as arrays and PO header fields once per PO
+            if (!data.success || data.format !== 'columnar') {
+                return data;
+            }
+
+            const rows = [];
+            for (let r = 0; r < data.row_count; r++) {
+                const row = {};
+                const header = data.headers[data.header_index[r]];
+                data.header_columns.forEach((column, c) => {
+                    row[column] = header[c];
+                });
+                for (const column in data.item_columns) {
+                    row[column] = data.item_columns[column][r];
+                }
+                rows.push(row);
+            }
+
+            data.data = rows;
+            return data;
+        }
+
+        function displayMasterReportData(data, append = false) {
+            const tbody = document.getElementById('master_report_tbody');
+            const startIndex = append ? tbody.children.length : 0;
+            if (!append) {
+                tbody.innerHTML = '';
+            }
+
+            data.forEach((row, rowIndex) => {
+                const index = startIndex + rowIndex;
+                const tr = document.createElement('tr');
+                tr.style.borderBottom = '1px solid #dee2e6';
+
+                // Alternate row colors
+                if (index % 2 === 1) {
+                    tr.style.backgroundColor = '#f8f9fa';
+                }
+
+                tr.innerHTML = `
+                    <!-- Fixed Columns -->
+                    <td style="position: sticky; left: 0; background: ${index % 2 === 1 ? '#f8f9fa' : 'white'}; z-index: 5; padding: 8px; border-right: 2px solid #adb5bd; font-weight: 500; width: 120px; vertical-align: top;" title="${row.po_number || ''}">${row.po_number || ''}</td>
+                    <td style="position: sticky; left: 120px; background: ${index % 2 === 1 ? '#f8f9fa' : 'white'}; z-index: 5; padding: 8px; border-right: 2px solid #adb5bd; font-weight: 500; width: 140px; vertical-align: top;" title="${row.item_number || ''}">${row.item_number || ''}</td>
+                    <td style="position: sticky; left: 260px; background: ${index % 2 === 1 ? '#f8f9fa' : 'white'}; z-index: 5; padding: 8px; border-right: 2px solid #adb5bd; width: 250px; vertical-align: top;" title="${row.description || ''}">${row.description || ''}</td>
+
+                    <!-- Scrollable Columns -->
+                    <td style="padding: 8px; width: 120px; vertical-align: top;" title="${row.color || ''}">${row.color || ''}</td>
+                    <td style="padding: 8px; width: 140px; vertical-align: top;" title="${row.ship_to || ''}">${row.ship_to || ''}</td>
+                    <td style="padding: 8px; width: 120px; vertical-align: top;" title="${row.need_by || ''}">${row.need_by || ''}</td>
+                    <td style="padding: 8px; text-align: right; width: 100px; vertical-align: top;" title="${row.qty || ''}">${row.qty || ''}</td>
+                    <td style="padding: 8px; text-align: right; width: 120px; vertical-align: top;" title="${row.bundle_qty || ''}">${row.bundle_qty || ''}</td>
+                    <td style="padding: 8px; text-align: right; width: 120px; vertical-align: top;" title="${row.unit_price || ''}">${row.unit_price || ''}</td>
+                    <td style="padding: 8px; text-align: right; width: 120px; vertical-align: top;" title="${row.extension || ''}">${row.extension || ''}</td>
+                    <td style="padding: 8px; width: 150px; vertical-align: top;" title="${row.company || ''}">${row.company || ''}</td>
+                    <td style="padding: 8px; width: 160px; vertical-align: top;" title="${row.purchase_from || ''}">${row.purchase_from || ''}</td>
+                    <td style="padding: 8px; width: 100px; vertical-align: top;" title="${row.currency || ''}">${row.currency || ''}</td>
+                    <td style="padding: 8px; width: 120px; vertical-align: top;" title="${row.po_date || ''}">${row.po_date || ''}</td>
+                    <td style="padding: 8px; width: 130px; vertical-align: top;" title="${row.cancel_date || ''}">${row.cancel_date || ''}</td>
+                    <td style="padding: 8px; width: 120px; vertical-align: top;" title="${row.ship_by || ''}">${row.ship_by || ''}</td>
+                    <td style="padding: 8px; width: 140px; vertical-align: top;" title="${row.ship_via || ''}">${row.ship_via || ''}</td>
+                    <td style="padding: 8px; width: 130px; vertical-align: top;" title="${row.order_type || ''}">${row.order_type || ''}</td>
+                    <td style="padding: 8px; width: 100px; vertical-align: top;" title="${row.status || ''}">${row.status || ''}</td>
+                    <td style="padding: 8px; width: 150px; vertical-align: top;" title="${row.factory || ''}">${row.factory || ''}</td>
+                    <td style="padding: 8px; width: 120px; vertical-align: top;" title="${row.location || ''}">${row.location || ''}</td>
+                    <td style="padding: 8px; width: 130px; vertical-align: top;" title="${row.prod_rep || ''}">${row.prod_rep || ''}</td>
+                    <td style="padding: 8px; width: 200px; vertical-align: top;" title="${row.ship_to_address || ''}">${row.ship_to_address || ''}</td>
+                    <td style="padding: 8px; width: 130px; vertical-align: top;" title="${row.terms || ''}">${row.terms || ''}</td>
+                    <td style="padding: 8px; font-size: 0.8em; color: #666; width: 150px; vertical-align: top;" title="${row.first_created || ''}">${row.first_created || ''}</td>
+                    <td style="padding: 8px; font-size: 0.8em; color: #666; width: 150px; vertical-align: top;" title="${row.last_updated || ''}">${row.last_updated || ''}</td>
+                    <td style="padding: 8px; text-align: center; width: 120px; vertical-align: top;" title="${row.update_count || '0'}">${row.update_count || '0'}</td>
+                `;
+
+                tbody.appendChild(tr);
+            });
+        }
+
+        function updateMasterReportStats(data) {
+            const now = new Date().toLocaleString();
+            const activeFilters = getActiveFilterCount();
+
+            document.getElementById('master_report_stats').textContent =
+                `📊 Showing ${data.filtered_count} of ${data.total_count} total records | 🔍 Active filters: ${activeFilters} | 📅 Last updated: ${now}`;
+        }
+
+        function getActiveFilterCount() {
+            const searchInputs = document.querySelectorAll('#master_report_table input[id^="search_"]');
+            let count = 0;
+            searchInputs.forEach(input => {
+                if (input.value.trim()) count++;
+            });
+            return count;
+        }
+
+        function searchMasterReport() {
+            // Clear existing timeout
+            if (searchTimeout) {
+                clearTimeout(searchTimeout);
+            }
+
+            // Debounce search to avoid too many requests
+            searchTimeout = setTimeout(() => {
+                performMasterReportSearch();
+            }, 500);
+        }
+
+        function getMasterReportSearchParams() {
+            // Collect search filters
+            const searchParams = new URLSearchParams();
+            searchParams.append('limit', '20');
+            searchParams.append('format', 'columnar');
+            if (masterReportSort) {
+                searchParams.append('sort', masterReportSort);
+            }
+
+            const searchInputs = document.querySelectorAll('#master_report_table input[id^="search_"]');
+            searchInputs.forEach(input => {
+                if (input.value.trim()) {
+                    const columnName = input.id.replace('search_', '');
+                    searchParams.append(`search_${columnName}`, input.value.trim());
+                }
+            });
+
+            return searchParams;
+        }
+
+        function performMasterReportSearch() {
+            console.log('🔍 Performing master report search...');
+
+            const searchParams = getMasterReportSearchParams();
+
+            // Show loading state
+            document.getElementById('master_report_loading').style.display = 'block';
+            document.getElementById('master_report_container').style.display = 'none';
+
+            fetch(`/api/master_report?${searchParams.toString()}`)
+                .then(response => response.json())
+                .then(decodeMasterReportResponse)
+                .then(data => {
+                    console.log('📊 Search results received:', data);
+
+                    if (data.success) {
+                        masterReportData = data.data;
+                        masterReportNextCursor = data.next_cursor;
+                        displayMasterReportData(data.data);
+                        updateMasterReportStats(data);
+
+                        // Show table or empty state
+                        document.getElementById('master_report_loading').style.display = 'none';
+                        if (data.data.length > 0) {
+                            document.getElementById('master_report_container').style.display = 'block';
+                            document.getElementById('master_report_empty').style.display = 'none';
+                        } else {
+                            document.getElementById('master_report_container').style.display = 'none';
+                            document.getElementById('master_report_empty').style.display = 'block';
+                        }
+                    } else {
+                        showError('Search failed: ' + (data.error || 'Unknown error'));
+                        document.getElementById('master_report_loading').style.display = 'none';
+                        document.getElementById('master_report_empty').style.display = 'block';
+                    }
+                })
+                .catch(error => {
+                    console.error('❌ Error searching master report:', error);
+                    showError('Search failed: ' + error.message);
+                    document.getElementById('master_report_loading').style.display = 'none';
+                    document.getElementById('master_report_empty').style.display = 'block';
+                });
+        }
+
+        function sortMasterReport(column) {
+            // Cycle: ascending -> descending -> default order (sorting is done by the server)
+            if (masterReportSort === column) {
+                masterReportSort = '-' + column;
+            } else if (masterReportSort === '-' + column) {
+                masterReportSort = '';
+            } else {
+                masterReportSort = column;
+            }
+
+            document.querySelectorAll('#master_report_table span[id^="sort_indicator_"]').forEach(span => {
+                span.textContent = '';
+            });
+            if (masterReportSort) {
+                const indicator = document.getElementById('sort_indicator_' + masterReportSort.replace('-', ''));
+                indicator.textContent = masterReportSort.startsWith('-') ? ' ▼' : ' ▲';
+            }
+
+            performMasterReportSearch();
+        }
+
+        function refreshMasterReport() {
+            console.log('🔄 Refreshing master report...');
+            clearAllSearchFilters();
+            loadMasterReport();
+        }
+
+        function clearAllSearchFilters() {
+            console.log('🗑️ Clearing all search filters...');
+            const searchInputs = document.querySelectorAll('#master_report_table input[id^="search_"]');
+            searchInputs.forEach(input => {
+                input.value = '';
+            });
+            loadMasterReport();
+        }
+
+        function exportMasterReport() {
+            console.log('📥 Exporting master report to Excel...');
+
+            // Collect current search filters
+            const searchParams = new URLSearchParams();
+            const searchInputs = document.querySelectorAll('#master_report_table input[id^="search_"]');
+            searchInputs.forEach(input => {
+                if (input.value.trim()) {
+                    const columnName = input.id.replace('search_', '');
+                    searchParams.append(`search_${columnName}`, input.value.trim());
+                }
+            });
+
+            if (masterReportSort) {
+                searchParams.append('sort', masterReportSort);
+            }
+
+            // Create download URL
+            const exportUrl = `/api/export_master_report?${searchParams.toString()}`;
+
+            // Create temporary link and trigger download
+            const link = document.createElement('a');
+            link.href = exportUrl;
+            link.download = '';
+            document.body.appendChild(link);
+            link.click();
+            document.body.removeChild(link);
+
+            showSuccess('📥 Excel export started! Check your downloads folder.');
+        }
+
+        function loadMoreRecords() {
+            console.log('📄 Loading more records...');
+
+            if (!masterReportNextCursor) {
+                showInfo('📄 All matching records are already shown');
+                return;
+            }
+
+            const searchParams = getMasterReportSearchParams();
+            searchParams.append('cursor', masterReportNextCursor);
+
+            fetch(`/api/master_report?${searchParams.toString()}`)
+                .then(response => response.json())
+                .then(decodeMasterReportResponse)
+                .then(data => {
+                    if (data.success) {
+                        masterReportData = masterReportData.concat(data.data);
+                        masterReportNextCursor = data.next_cursor;
+                        displayMasterReportData(data.data, true);
+                        updateMasterReportStats({
+                            filtered_count: masterReportData.length,
+                            total_count: data.total_count
+                        });
+                    } else {
+                        showError('Load more failed: ' + (data.error || 'Unknown error'));
+                    }
+                })
+                .catch(error => {
+                    console.error('❌ Error loading more records:', error);
+                    showError('Load more failed: ' + error.message);
+                });
+        }
+
+        export {
+            generateReport,
+            exportReport,
+            loadMasterReport,
+            decodeMasterReportResponse,
+            displayMasterReportData,
+            updateMasterReportStats,
+            getActiveFilterCount,
+            searchMasterReport,
+            getMasterReportSearchParams,
+            performMasterReportSearch,
+            sortMasterReport,
+            refreshMasterReport,
+            clearAllSearchFilters,
+            exportMasterReport,
+            loadMoreRecords
+        };
@@ -0,0 +1,185 @@
+        // Settings tab - ES module loaded by loadTabModule() the first time the tab opens.
+        // Shared state and helpers (currentPO, showError, ...) come from app.js.
+
+        // Settings functions
+        async function verifyAdmin() {
+            const password = document.getElementById('admin_password').value;
+            const messageDiv = document.getElementById('admin_message');
+
+            if (!password) {
+                messageDiv.textContent = 'Please enter admin password';
+                messageDiv.style.color = 'red';
+                return;
+            }
+
+            try {
+                const response = await fetch('/api/settings/verify_admin', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({password: password})
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    messageDiv.textContent = '✅ Admin access granted';
+                    messageDiv.style.color = 'green';
+
+                    // Load and show configuration
+                    await loadConfiguration(password);
+                } else {
+                    messageDiv.textContent = '❌ Invalid admin password';
+                    messageDiv.style.color = 'red';
+                }
+            } catch (error) {
+                messageDiv.textContent = '❌ Error: ' + error.message;
+                messageDiv.style.color = 'red';
+            }
+        }
+
+        async function loadConfiguration(password) {
+            try {
+                const response = await fetch('/api/settings/get_config', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({password: password})
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    // Show actual values
+                    document.getElementById('display_url').textContent = result.config.login_url;
+                    document.getElementById('display_username').textContent = result.config.username;
+                    document.getElementById('display_password').textContent = result.config.password;
+
+                    // Populate edit form
+                    document.getElementById('edit_url').value = result.config.login_url;
+                    document.getElementById('edit_username').value = result.config.username;
+                    document.getElementById('edit_password').value = result.config.password;
+
+                    // Show edit form
+                    document.getElementById('edit_form').style.display = 'block';
+                    document.getElementById('admin_section').style.display = 'none';
+                }
+            } catch (error) {
+                console.error('Error loading configuration:', error);
+            }
+        }
+
+        async function saveConfig() {
+            const adminPassword = document.getElementById('admin_password').value;
+            const url = document.getElementById('edit_url').value;
+            const username = document.getElementById('edit_username').value;
+            const password = document.getElementById('edit_password').value;
+            const messageDiv = document.getElementById('save_message');
+
+            try {
+                const response = await fetch('/api/settings/update_config', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify({
+                        admin_password: adminPassword,
+                        login_url: url,
+                        username: username,
+                        password: password
+                    })
+                });
+
+                const result = await response.json();
+
+                if (result.success) {
+                    messageDiv.innerHTML = '<span style="color: green;">✅ Configuration saved successfully!</span>';
+
+                    // Update display
+                    document.getElementById('display_url').textContent = url;
+                    document.getElementById('display_username').textContent = username;
+                    document.getElementById('display_password').textContent = password;
+                } else {
+                    messageDiv.innerHTML = '<span style="color: red;">❌ ' + result.message + '</span>';
+                }
+            } catch (error) {
+                messageDiv.innerHTML = '<span style="color: red;">❌ Error: ' + error.message + '</span>';
+            }
+        }
+
+        function cancelEdit() {
+            document.getElementById('edit_form').style.display = 'none';
+            document.getElementById('admin_section').style.display = 'block';
+            document.getElementById('admin_password').value = '';
+            document.getElementById('admin_message').textContent = '';
+
+            // Reset display to masked values
+            const currentUsername = document.getElementById('edit_username').value || document.getElementById('display_username').dataset.masked;
+            document.getElementById('display_username').textContent = maskEmail(currentUsername);
+            document.getElementById('display_password').textContent = '************';
+        }
+
+        const RATE_LIMIT_FIELDS = ['requests_per_second', 'burst', 'slow_response_seconds', 'max_backoff_seconds'];
+
+        function displayRateLimit(result) {
+            RATE_LIMIT_FIELDS.forEach(field => {
+                document.getElementById(`rate_${field}`).value = result.settings[field];
+            });
+
+            const rows = result.hosts.map(host =>
+                `<tr><td style="padding: 4px 8px;">${host.host}</td><td style="padding: 4px 8px;">${host.effective_rate}/s</td>` +
+                `<td style="padding: 4px 8px;">${host.requests} requests</td><td style="padding: 4px 8px;">${host.errors} errors</td>` +
+                `<td style="padding: 4px 8px;">${host.paused_for > 0 ? '⏸️ paused ' + host.paused_for + 's' : '✅ active'}</td></tr>`
+            ).join('');
+            document.getElementById('rate_limit_hosts').innerHTML = rows
+                ? `<table style="border-collapse: collapse; font-size: 13px;">${rows}</table>`
+                : '<span style="color: #666;">No BrandID requests yet</span>';
+        }
+
+        async function loadRateLimitSettings() {
+            try {
+                const response = await fetch('/api/settings/rate_limit');
+                displayRateLimit(await response.json());
+            } catch (error) {
+                document.getElementById('rate_limit_message').innerHTML = '<span style="color: red;">❌ Error: ' + error.message + '</span>';
+            }
+        }
+
+        async function saveRateLimitSettings() {
+            const messageDiv = document.getElementById('rate_limit_message');
+            const body = {admin_password: document.getElementById('admin_password').value};
+            RATE_LIMIT_FIELDS.forEach(field => {
+                body[field] = document.getElementById(`rate_${field}`).value;
+            });
+
+            try {
+                const response = await fetch('/api/settings/rate_limit', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify(body)
+                });
+                const result = await response.json();
+
+                if (result.success) {
+                    messageDiv.innerHTML = '<span style="color: green;">✅ Rate limit saved</span>';
+                    displayRateLimit(result);
+                } else {
+                    messageDiv.innerHTML = '<span style="color: red;">❌ ' + result.message + '</span>';
+                }
+            } catch (error) {
+                messageDiv.innerHTML = '<span style="color: red;">❌ Error: ' + error.message + '</span>';
+            }
+        }
+
+        function initTab() {
+            // The settings markup is a cached static file, so the masked username comes from the page shell
+            const display = document.getElementById('display_username');
+            display.dataset.masked = window.MASKED_USERNAME;
+            display.textContent = window.MASKED_USERNAME;
+        }
+
+        export {
+            initTab,
+            verifyAdmin,
+            loadConfiguration,
+            saveConfig,
+            cancelEdit,
+            loadRateLimitSettings,
+            saveRateLimitSettings
+        };
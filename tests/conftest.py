@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture
+def temp_database(tmp_path, monkeypatch):
+    """Run with po_database.db (opened by relative path) in an empty temp directory"""
+    import artwork_url_cache
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(artwork_url_cache, '_table_ready', False)
+    return tmp_path
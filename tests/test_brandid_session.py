@@ -0,0 +1,71 @@
+import os
+import stat
+
+import pytest
+import requests
+
+import brandid_session
+
+
+class FakeResponse:
+    status_code = 200
+    text = '<html>Purchase Orders</html>'
+
+
+def test_probe_keeps_same_named_cookies_apart_per_domain(monkeypatch):
+    sent = {}
+
+    def fake_get(url, cookies=None, **kwargs):
+        sent['cookie'] = requests.Request('GET', url, cookies=cookies).prepare().headers.get('Cookie')
+        return FakeResponse()
+
+    monkeypatch.setattr(requests, 'get', fake_get)
+    session = {
+        'landing_url': 'https://app.e-brandid.com/Bidnet/bidnet3/factoryPODetail.aspx',
+        'cookies': [
+            {'name': 'ASP.NET_SessionId', 'value': 'app-session', 'domain': 'app.e-brandid.com', 'path': '/'},
+            {'name': 'ASP.NET_SessionId', 'value': 'artwork-session', 'domain': 'app4.brandid.com', 'path': '/'},
+        ]
+    }
+
+    assert brandid_session.probe(session)
+    assert sent['cookie'] == 'ASP.NET_SessionId=app-session'
+
+
+def fake_dpapi(data, protect):
+    # Reversible stand-in for CryptProtectData / CryptUnprotectData
+    return bytes(byte ^ 0x5A for byte in data)
+
+
+COOKIES = [{'name': 'ASP.NET_SessionId', 'value': 'secret-cookie', 'domain': 'app.e-brandid.com', 'path': '/'}]
+
+
+def test_windows_jar_is_dpapi_encrypted_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(brandid_session, 'SESSION_FILE', str(tmp_path / 'brandid_session.json'))
+    monkeypatch.setattr(brandid_session, 'PROTECT_WITH_DPAPI', True)
+    monkeypatch.setattr(brandid_session, '_dpapi', fake_dpapi)
+
+    brandid_session.save('user@example.com', 'https://app.e-brandid.com/', COOKIES)
+
+    raw = (tmp_path / 'brandid_session.json').read_text(encoding='utf-8')
+    assert 'secret-cookie' not in raw and 'user@example.com' not in raw
+    assert brandid_session.load()['cookies'] == COOKIES
+
+
+def test_plaintext_jar_is_ignored_on_windows(tmp_path, monkeypatch):
+    monkeypatch.setattr(brandid_session, 'SESSION_FILE', str(tmp_path / 'brandid_session.json'))
+    monkeypatch.setattr(brandid_session, 'PROTECT_WITH_DPAPI', False)
+    brandid_session.save('user@example.com', 'https://app.e-brandid.com/', COOKIES)
+
+    monkeypatch.setattr(brandid_session, 'PROTECT_WITH_DPAPI', True)
+    monkeypatch.setattr(brandid_session, '_dpapi', fake_dpapi)
+    assert brandid_session.load() is None
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='file modes are not enforced on Windows')
+def test_posix_jar_is_owner_only(tmp_path, monkeypatch):
+    monkeypatch.setattr(brandid_session, 'SESSION_FILE', str(tmp_path / 'brandid_session.json'))
+    brandid_session.save('user@example.com', 'https://app.e-brandid.com/', COOKIES)
+
+    assert stat.S_IMODE(os.stat(tmp_path / 'brandid_session.json').st_mode) == 0o600
+    assert brandid_session.load()['cookies'] == COOKIES
@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+import browser_tools
+
+
+@pytest.fixture
+def chrome_starts(monkeypatch):
+    """Record _start_chrome calls; paths listed in failing raise like a broken driver"""
+    calls = []
+    failing = set()
+
+    def fake_start(path, chrome_options):
+        calls.append(path)
+        if path in failing:
+            raise RuntimeError(f'driver {path} failed')
+        return f'driver:{path}'
+
+    monkeypatch.setattr(browser_tools, '_start_chrome', fake_start)
+    monkeypatch.setattr(browser_tools, '_resolved', dict(browser_tools._resolved))
+    return calls, failing
+
+
+def fake_resolver(monkeypatch, source, paths):
+    def resolve(refresh=False):
+        browser_tools._resolved['source'] = source
+        return paths['refresh' if refresh else 'first']
+    monkeypatch.setattr(browser_tools, 'resolve_chromedriver', resolve)
+
+
+def test_fresh_webdriver_manager_driver_failing_falls_back_to_selenium_manager(chrome_starts, monkeypatch):
+    calls, failing = chrome_starts
+    fake_resolver(monkeypatch, 'webdriver_manager', {'first': '/wdm/chromedriver', 'refresh': None})
+    failing.add('/wdm/chromedriver')
+
+    assert browser_tools.launch_chrome(object()) == 'driver:None'
+    assert calls == ['/wdm/chromedriver', None]
+
+
+def test_stale_cached_driver_is_resolved_again_before_selenium_manager(chrome_starts, monkeypatch):
+    calls, failing = chrome_starts
+    fake_resolver(monkeypatch, 'cache', {'first': '/cache/old', 'refresh': '/wdm/new'})
+    failing.update({'/cache/old', '/wdm/new'})
+
+    assert browser_tools.launch_chrome(object()) == 'driver:None'
+    assert calls == ['/cache/old', '/wdm/new', None]
+
+
+def test_selenium_manager_failure_is_raised(chrome_starts, monkeypatch):
+    calls, failing = chrome_starts
+    fake_resolver(monkeypatch, 'selenium', {'first': None, 'refresh': None})
+    failing.add(None)
+
+    with pytest.raises(RuntimeError):
+        browser_tools.launch_chrome(object())
+    assert calls == [None]
+
+
+class ZeroRowPage:
+    """A loaded PO page whose item table has no rows"""
+
+    def __init__(self, empty):
+        self.empty = empty
+
+    def execute_script(self, script, *args):
+        if args:
+            return 0  # querySelectorAll(selector).length
+        return self.empty
+
+
+def test_stable_count_returns_early_on_a_page_with_zero_rows():
+    started = time.monotonic()
+    count = browser_tools.wait_for_stable_count(ZeroRowPage(empty=True), 'a.item', timeout=15, settle=0.2,
+                                                name='zero_rows', empty_script='return true')
+    assert count == 0
+    assert time.monotonic() - started < 2
+    assert browser_tools.get_wait_stats()['zero_rows']['timeouts'] == 0
+
+
+def test_stable_count_still_waits_for_rows_until_the_page_says_it_is_empty():
+    count = browser_tools.wait_for_stable_count(ZeroRowPage(empty=False), 'a.item', timeout=0.5, settle=0.1,
+                                                name='still_loading', empty_script='return false')
+    assert count == 0
+    assert browser_tools.get_wait_stats()['still_loading']['timeouts'] == 1
+
+
+class CdpDriver:
+    """Records CDP commands per window, like ChromeDriver's per-target DevTools sessions"""
+
+    def __init__(self):
+        self.current = 'main'
+        self.commands = []
+        driver = self
+
+        class SwitchTo:
+            def window(self, handle):
+                driver.current = handle
+
+        self.switch_to = SwitchTo()
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((self.current, command, params))
+
+
+def test_popups_of_a_blocking_driver_get_blocking_reissued():
+    driver = CdpDriver()
+    assert browser_tools.enable_resource_blocking(driver)
+
+    browser_tools.switch_to_window(driver, 'popup')
+
+    blocked = [(window, params['urls']) for window, command, params in driver.commands if command == 'Network.setBlockedURLs']
+    assert blocked == [('main', browser_tools.BLOCKED_URL_PATTERNS), ('popup', browser_tools.BLOCKED_URL_PATTERNS)]
+    assert not any(pattern.endswith('.pdf') for pattern in browser_tools.BLOCKED_URL_PATTERNS)
+
+
+def test_popups_of_a_plain_driver_are_left_alone():
+    driver = CdpDriver()
+    browser_tools.switch_to_window(driver, 'popup')
+    assert driver.current == 'popup' and driver.commands == []
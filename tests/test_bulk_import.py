@@ -0,0 +1,38 @@
+import smart_app
+
+
+class FakeDriver:
+    instances = []
+
+    def __init__(self):
+        self.quit_called = False
+        FakeDriver.instances.append(self)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_browsers_that_fail_login_are_quit_immediately(temp_database, monkeypatch):
+    FakeDriver.instances = []
+    open_when_login_ran = []
+
+    def failing_login(driver):
+        open_when_login_ran.append(sum(not d.quit_called for d in FakeDriver.instances))
+        raise RuntimeError('bad credentials')
+
+    monkeypatch.setattr(smart_app, 'create_scrape_driver', lambda **kwargs: FakeDriver())
+    monkeypatch.setattr(smart_app, 'login_brandid_driver', failing_login)
+
+    smart_app.init_database()
+    po_numbers = [str(1000000 + i) for i in range(20)]
+    job_id = smart_app.create_background_job(
+        'po_bulk_import', total=len(po_numbers), completed=0, workers=2, overwrite=True,
+        po_status={po_number: {'status': 'queued', 'message': ''} for po_number in po_numbers}
+    )
+    smart_app.run_bulk_po_import(job_id, po_numbers, overwrite=True, workers=2)
+
+    job = smart_app.get_background_job(job_id)
+    assert all(status['status'] == 'failed' for status in job['po_status'].values())
+    # Each failed login quits its browser before the next one starts
+    assert max(open_when_login_ran) <= 2
+    assert all(driver.quit_called for driver in FakeDriver.instances)
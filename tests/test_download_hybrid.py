@@ -0,0 +1,85 @@
+import threading
+
+import smart_app
+
+
+class FakeResponse:
+    def __init__(self, status_code, text='', content=b''):
+        self.status_code = status_code
+        self.text = text
+        self.content = content
+        self.headers = {}
+
+
+class FakeDriver:
+    def __init__(self, html, link_count):
+        self.page_source = html
+        self.link_count = link_count
+
+    def find_elements(self, *args):
+        return list(range(self.link_count))
+
+    def get_cookies(self):
+        return [{'name': 'ASP.NET_SessionId', 'value': 'x', 'domain': 'app.e-brandid.com', 'path': '/'}]
+
+    def quit(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, requested, names_by_detail_id):
+        self.requested = requested
+        self.names_by_detail_id = names_by_detail_id
+        self.lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        with self.lock:
+            self.requested.append(url)
+        if 'itemDetail.aspx' in url:
+            detail_id = int(url.split('id=')[1].split('&')[0])
+            pdf_url = f"https://app4.brandid.com/Artwork/{self.names_by_detail_id[detail_id]}_{detail_id + 800}.pdf"
+            return FakeResponse(200, text=f"<a onclick=\"MM_openBrWindow('{pdf_url}','a','')\">Download</a>")
+        return FakeResponse(200, content=b'%PDF-1.4 artwork')
+
+
+def test_hybrid_only_resolves_and_fetches_selected_items(temp_database, monkeypatch):
+    # 10 item links; ITEM03 appears twice so the selection keeps both of its rows
+    names = [f"ITEM{i:02d}" for i in range(9)] + ['ITEM03']
+    rows = ''.join(f"<tr><td><a onclick=\"openItemDetail('{100 + i}','{900 + i}')\">{name}</a></td></tr>"
+                   for i, name in enumerate(names))
+    driver = FakeDriver(f"<html><body><table>{rows}</table></body></html>", len(names))
+
+    popups = []
+    requested = []
+
+    def fake_popup(driver, link_index, item_name):
+        popups.append(item_name)
+        detail_id, suffix_id = 100 + link_index, 900 + link_index
+        return (f"https://app4.brandid.com/Artwork/{item_name}_{suffix_id}.pdf",
+                f"https://app.e-brandid.com/Bidnet/bidnet3/itemDetail.aspx?id={detail_id}&sid={suffix_id}")
+
+    monkeypatch.setattr(smart_app, 'create_scrape_driver', lambda **kwargs: driver)
+    monkeypatch.setattr(smart_app, 'login_brandid_driver', lambda driver: True)
+    monkeypatch.setattr(smart_app, 'throttled_get', lambda driver, url: None)
+    monkeypatch.setattr(smart_app.browser_tools, 'wait_for_page_ready', lambda *args, **kwargs: None)
+    monkeypatch.setattr(smart_app.browser_tools, 'wait_for_stable_count', lambda *args, **kwargs: None)
+    monkeypatch.setattr(smart_app, 'resolve_pdf_url_in_popup', fake_popup)
+    monkeypatch.setattr(smart_app, 'brandid_requests_session', lambda cookies: FakeSession(requested, {100 + i: name for i, name in enumerate(names)}))
+    monkeypatch.setattr(smart_app.rate_limiter, 'acquire', lambda host: 0.0)
+    monkeypatch.setattr(smart_app, 'download_status', {'active': True, 'progress': 0, 'log': []})
+
+    download_folder = temp_database / 'download'
+    download_folder.mkdir()
+    items = [{'name': 'ITEM03'}, {'name': 'ITEM07'}]
+
+    result = smart_app.download_hybrid('1234567', items, str(download_folder))
+
+    # One popup teaches the detail URL, the other selected rows are resolved over HTTP
+    detail_ids = sorted(url.split('id=')[1].split('&')[0] for url in requested if 'itemDetail.aspx' in url)
+    assert popups == ['ITEM03']
+    assert detail_ids == ['107', '109']  # ITEM07 and the second ITEM03 row
+
+    fetched = sorted(url.rsplit('/', 1)[1] for url in requested if url.endswith('.pdf'))
+    assert fetched == ['ITEM03_903.pdf', 'ITEM03_909.pdf', 'ITEM07_907.pdf']
+    assert sorted(path.name for path in download_folder.iterdir()) == fetched
+    assert result == (3, 3)  # files downloaded, links attempted
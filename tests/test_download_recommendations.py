@@ -0,0 +1,58 @@
+import smart_app
+
+
+def test_defaults_do_not_rank_unmeasured_super_fast_first(temp_database):
+    smart_app.init_database()
+    for item_count in (1, 5, 10, 30, 100, 500):
+        recommendations = smart_app.analyze_po_and_recommend('1234567', item_count, [])
+        assert recommendations[0]['method'] != 'super_fast'
+
+
+def test_ranking_matches_the_time_shown(temp_database):
+    smart_app.init_database()
+    smart_app.record_download_run('1', 'super_fast', 20, 0.0, 5, 1000, 10)
+    smart_app.record_download_run('1', 'hybrid', 20, 0.0, 20, 1000, 60)
+
+    recommendations = smart_app.analyze_po_and_recommend('1234567', 30, [])
+    shown = [rec['expected_seconds'] for rec in recommendations]
+    assert shown == sorted(shown)
+    assert all(rec['expected'] == smart_app.format_eta(rec['expected_seconds']) for rec in recommendations)
+
+
+def test_run_keeps_true_success_ratio_of_attempted_links(temp_database):
+    smart_app.init_database()
+    smart_app.record_download_run('1', 'guaranteed_complete', 12, 0.25, 9, 5000, 60)
+
+    import sqlite3
+    conn = sqlite3.connect('po_database.db')
+    row = conn.execute('SELECT item_count, success_rate, seconds_per_item FROM download_runs').fetchone()
+    conn.close()
+    assert row == (12, 0.75, 5.0)
+
+
+def test_link_counts_are_keyed_by_stripped_po_number(monkeypatch):
+    monkeypatch.setattr(smart_app, 'po_link_counts', {'1234567': (10, 6)})
+    assert smart_app.duplicate_ratio_for(' 1234567 ', []) == 0.4
+
+
+def test_standard_and_guaranteed_runs_pool_into_one_entry(temp_database):
+    smart_app.init_database()
+    smart_app.record_download_run('1', 'standard', 10, 0.0, 10, 1000, 40)
+    smart_app.record_download_run('2', 'guaranteed_complete', 20, 0.0, 20, 1000, 70)
+
+    import sqlite3
+    conn = sqlite3.connect('po_database.db')
+    assert [method for (method,) in conn.execute('SELECT method FROM download_runs')] == ['guaranteed_complete'] * 2
+    # A run recorded under the alias before keys were normalised still counts
+    conn.execute("INSERT INTO download_runs (po_number, method, item_count, duplicate_ratio, success_count, success_rate, "
+                 "duration_seconds) VALUES ('3', 'standard', 30, 0.0, 30, 1.0, 100)")
+    conn.commit()
+    conn.close()
+
+    recommendations = smart_app.analyze_po_and_recommend('1234567', 15, [])
+    methods = [rec['method'] for rec in recommendations]
+    assert 'standard' not in methods
+    assert methods.count('guaranteed_complete') == 1
+    guaranteed = recommendations[methods.index('guaranteed_complete')]
+    assert guaranteed['samples'] == 3
+    assert guaranteed['aliases'] == ['standard']
@@ -0,0 +1,14 @@
+import smart_app
+
+
+def key_for(value):
+    return smart_app.normalize_master_report_key(20, {'description': value}, None)
+
+
+def test_ascii_case_is_folded_like_sqlite_like():
+    assert key_for(' Hang Tag ') == key_for('hang tag')
+
+
+def test_non_ascii_case_is_kept_because_like_does_not_fold_it():
+    assert key_for('ÉTIQUETTE') != key_for('étiquette')
+    assert key_for('Äpfel') != key_for('äpfel')
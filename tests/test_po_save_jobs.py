@@ -0,0 +1,72 @@
+import threading
+
+import smart_app
+
+
+def test_overwrite_save_does_not_join_a_running_plain_save(monkeypatch):
+    # Leave every job queued so repeated clicks find it still active
+    monkeypatch.setattr(smart_app, 'run_po_save_job', lambda job_id, po_number, overwrite: None)
+    client = smart_app.app.test_client()
+
+    def save(overwrite):
+        response = client.post('/api/po/save_details', json={'po_number': '1288060', 'overwrite': overwrite})
+        assert response.status_code == 202
+        return response.get_json()['job_id']
+
+    plain = save(False)
+    assert save(False) == plain
+    overwriting = save(True)
+    assert overwriting != plain
+    assert save(True) == overwriting
+
+
+def test_simultaneous_saves_of_one_po_share_a_single_job():
+    barrier = threading.Barrier(16)
+    results = []
+
+    def request_save():
+        barrier.wait()
+        results.append(smart_app.find_or_create_background_job('po_save', {'po_number': '1288061', 'overwrite': False}))
+
+    threads = [threading.Thread(target=request_save) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({job_id for job_id, _ in results}) == 1
+    assert sum(created for _, created in results) == 1
+
+
+class FakeDriver:
+    def quit(self):
+        pass
+
+
+def test_concurrent_saves_do_not_share_a_debugging_port(monkeypatch):
+    both_open = threading.Barrier(2, timeout=5)
+    arguments = []
+
+    def fake_launch(chrome_options, block_resources=False):
+        arguments.append(list(chrome_options.arguments))
+        return FakeDriver()
+
+    def fake_login(driver):
+        both_open.wait()  # Both browsers are alive at the same time
+
+    monkeypatch.setattr(smart_app.browser_tools, 'launch_chrome', fake_launch)
+    monkeypatch.setattr(smart_app, 'login_brandid_driver', fake_login)
+    monkeypatch.setattr(smart_app, 'scrape_po_with_driver', lambda driver, po_number: {'success': False, 'po_number': po_number})
+
+    job_ids = [smart_app.create_background_job('po_save', po_number=po_number, overwrite=False)
+               for po_number in ('1288062', '1288063')]
+    threads = [threading.Thread(target=smart_app.run_po_save_job, args=(job_id, po_number, False))
+               for job_id, po_number in zip(job_ids, ('1288062', '1288063'))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(arguments) == 2
+    ports = [arg for args in arguments for arg in args if arg.startswith('--remote-debugging-port')]
+    assert len(ports) == len(set(ports))
@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold start to first page should be well under a second; the import is most of it
+IMPORT_BUDGET_SECONDS = 1.0
+DEFERRED_MODULES = ('selenium', 'webdriver_manager', 'pandas')
+
+
+def test_import_smart_app_is_fast_and_defers_heavy_modules(tmp_path):
+    check = ("import smart_app, sys; "
+             f"loaded = [m for m in {DEFERRED_MODULES!r} if m in sys.modules]; "
+             "assert not loaded, f'imported at startup: {loaded}'")
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', check], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=30)
+    elapsed = time.perf_counter() - started
+
+    assert result.returncode == 0, result.stderr
+    assert elapsed < IMPORT_BUDGET_SECONDS, f"import smart_app took {elapsed:.2f}s"
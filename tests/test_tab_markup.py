@@ -0,0 +1,28 @@
+import json
+import re
+
+import smart_app
+
+
+def test_deferred_tabs_are_not_in_the_page_shell():
+    client = smart_app.app.test_client()
+    page = client.get('/').get_data(as_text=True)
+
+    assert 'id="po_input"' in page  # Artwork is shown on load
+    for marker in ('id="delivery_notes"', 'id="master_report_container"', 'id="carton_modal"', 'id="rate_limit_hosts"'):
+        assert marker not in page
+    markup_urls = json.loads(re.search(r'window\.TAB_MARKUP_URLS = (\{.*?\});', page).group(1))
+    assert sorted(markup_urls) == sorted(smart_app.TAB_MARKUP)
+
+
+def test_tab_markup_is_served_as_cacheable_html():
+    client = smart_app.app.test_client()
+    for tab, marker in (('delivery', 'id="delivery_notes"'), ('po', 'id="carton_modal"'),
+                        ('report', 'id="master_report_container"'), ('settings', 'id="display_username"')):
+        response = client.get(smart_app.asset_url(f'tabs/{tab}.html'))
+        assert response.status_code == 200
+        assert response.mimetype == 'text/html'
+        assert 'immutable' in response.headers['Cache-Control']
+        markup = response.get_data(as_text=True)
+        assert marker in markup
+        assert markup.count('<div') == markup.count('</div>')
@@ -1,27 +1,41 @@
 """
 Unified E-BrandID Downloader - All methods in one UI
 Choose your download method and options from a single interface
+
+E-BrandID credentials come from the BRANDID_USERNAME / BRANDID_PASSWORD
+environment variables, or are asked for at startup.
 """
 
 import os
+import getpass
 import glob
 import time
 import shutil
 import re
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+import rate_limiter
+import brandid_session
+import browser_tools
+import artwork_url_cache
 
 class UnifiedDownloader:
-    def __init__(self):
+    def __init__(self, username=None, password=None):
         self.driver = None
         self.wait = None
+        self.username = username or os.environ.get('BRANDID_USERNAME', '')
+        self.password = password or os.environ.get('BRANDID_PASSWORD', '')
+
+    def get_credentials(self):
+        """Ask for whichever E-BrandID credential is not configured"""
+        while not self.username:
+            self.username = input("E-BrandID username: ").strip()
+        while not self.password:
+            self.password = getpass.getpass("E-BrandID password: ")
         
     def show_main_menu(self):
         """Show main menu with all download options"""
@@ -121,22 +135,16 @@ class UnifiedDownloader:
         }
         
         # Method-specific optimizations
-        if method in [2, 3, 4]:  # Speed methods
-            chrome_options.add_argument("--disable-images")
+        if method in [2, 3, 4]:  # Speed methods (images are off for every method, see launch_chrome)
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-plugins")
-            prefs["profile.managed_default_content_settings.images"] = 2
         
         chrome_options.add_experimental_option("prefs", prefs)
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         
-        try:
-            driver_path = ChromeDriverManager().install()
-            service = Service(driver_path)
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        except:
-            self.driver = webdriver.Chrome(options=chrome_options)
+        # No images, fonts or CSS in the PO page or the item popups (PDFs still download)
+        self.driver = browser_tools.launch_chrome(chrome_options, block_resources=True)
         
         self.wait = WebDriverWait(self.driver, 10)
         
@@ -150,18 +158,27 @@ class UnifiedDownloader:
         """Login to E-BrandID"""
         print("📝 Logging in...")
         
-        self.driver.get("https://app.e-brandid.com/login/login.aspx")
+        username = self.username
+        if brandid_session.restore(self.driver, username):
+            print("✅ Reusing saved session!")
+            return
+        
+        login_url = "https://app.e-brandid.com/login/login.aspx"
+        with rate_limiter.throttled(login_url):
+            self.driver.get(login_url)
         
         username_field = self.wait.until(EC.presence_of_element_located((By.ID, "txtUserName")))
         password_field = self.driver.find_element(By.ID, "txtPassword")
         
-        username_field.send_keys("sales10@fuchanghk.com")
-        password_field.send_keys("fc31051856")
+        username_field.send_keys(username)
+        password_field.send_keys(self.password)
         
         login_button = self.driver.find_element(By.XPATH, "//img[@onclick='return Login();']")
+        rate_limiter.acquire(login_url)
         login_button.click()
         
         self.wait.until(lambda d: "login" not in d.current_url.lower())
+        brandid_session.capture(self.driver, username)
         print("✅ Login successful!")
     
     def navigate_to_po(self, po_number):
@@ -169,7 +186,8 @@ class UnifiedDownloader:
         print(f"🔍 Navigating to PO {po_number}...")
         
         po_url = f"https://app.e-brandid.com/Bidnet/bidnet3/factoryPODetail.aspx?po_id={po_number}"
-        self.driver.get(po_url)
+        with rate_limiter.throttled(po_url):
+            self.driver.get(po_url)
         
         self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
         
@@ -219,9 +237,35 @@ class UnifiedDownloader:
                 return new_name
             counter += 1
     
+    def resolve_pdf_url(self, link):
+        """Open an item's popup and read the PDF URL from its Download button (None on failure)"""
+        handles_before = self.driver.window_handles
+        rate_limiter.acquire('app.e-brandid.com')
+        self.driver.execute_script("arguments[0].click();", link)
+
+        # Wait for popup
+        popup = browser_tools.wait_for_new_window(self.driver, handles_before, timeout=3)
+        if not popup:
+            return None
+
+        browser_tools.switch_to_window(self.driver, popup)
+        pdf_url = None
+        try:
+            # Find download button and extract PDF URL
+            download_button = WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.XPATH, "//a[contains(text(), 'Download')]"))
+            )
+            pdf_url = artwork_url_cache.parse_pdf_url(download_button.get_attribute('onclick'))
+        except Exception:
+            pass
+
+        # Close popup
+        self.driver.close()
+        self.driver.switch_to.window(self.driver.window_handles[0])
+        return pdf_url
+
     def process_items_method5(self, item_links, download_folder):
         """Method 5: Guaranteed Complete Download with numbered duplicates"""
-        import re
         import requests
         import shutil
 
@@ -234,49 +278,31 @@ class UnifiedDownloader:
         print(f"⚡ Processing {total_items} items with 100% success rate...")
         start_time = time.time()
 
+        # Items resolved on an earlier run skip the popup
+        link_info = []
+        for link in item_links:
+            item_name = link.text.strip()
+            link_info.append((link, item_name, artwork_url_cache.make_key(link.get_attribute('onclick'), item_name)))
+        cached_urls = artwork_url_cache.lookup_many([key for _, _, key in link_info])
+        if cached_urls:
+            print(f"⚡ {len(cached_urls)}/{total_items} PDF URLs known from earlier downloads")
+
         # Step 1: Extract all PDF URLs
         item_data = []
-        for i, link in enumerate(item_links):
+        for i, (link, item_name, key) in enumerate(link_info):
+            if key in cached_urls:
+                pdf_url = cached_urls[key]['pdf_url']
+                item_data.append((item_name, pdf_url, os.path.basename(pdf_url), link, key, True))
+                continue
+
             try:
-                item_name = link.text.strip()
                 print(f"🔍 Extracting {i+1}/{total_items}: {item_name}")
-
-                # Click item to open popup
-                original_windows = len(self.driver.window_handles)
-                self.driver.execute_script("arguments[0].click();", link)
-
-                # Wait for popup
-                popup_opened = False
-                for wait_attempt in range(30):
-                    time.sleep(0.1)
-                    if len(self.driver.window_handles) > original_windows:
-                        popup_opened = True
-                        break
-
-                if popup_opened:
-                    self.driver.switch_to.window(self.driver.window_handles[-1])
-
-                    try:
-                        # Find download button and extract PDF URL
-                        download_button = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.XPATH, "//a[contains(text(), 'Download')]"))
-                        )
-
-                        onclick_attr = download_button.get_attribute('onclick')
-                        # Extract PDF URL from onclick
-                        match = re.search(r"MM_openBrWindow\('([^']+\.pdf)'", onclick_attr)
-                        if match:
-                            pdf_url = match.group(1)
-                            original_filename = os.path.basename(pdf_url)
-                            item_data.append((item_name, pdf_url, original_filename))
-
-                    except Exception as e:
-                        failed_items.append(item_name)
-
-                    # Close popup
-                    self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
-                    time.sleep(0.5)
+                pdf_url = self.resolve_pdf_url(link)
+                if pdf_url:
+                    artwork_url_cache.store(key, pdf_url)
+                    item_data.append((item_name, pdf_url, os.path.basename(pdf_url), link, key, False))
+                else:
+                    failed_items.append(item_name)
 
             except Exception as e:
                 failed_items.append(item_name)
@@ -286,8 +312,17 @@ class UnifiedDownloader:
         print(f"\n📥 Downloading {len(item_data)} PDFs with smart numbering...")
         download_counter = {}
         unique_pdfs = {}
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+
+        def fetch(pdf_url):
+            with rate_limiter.throttled(pdf_url) as call:
+                response = session.get(pdf_url, timeout=30)
+                call.status_code = response.status_code
+                call.retry_after = rate_limiter.parse_retry_after(response.headers.get('Retry-After'))
+            return response
 
-        for i, (item_name, pdf_url, original_filename) in enumerate(item_data):
+        for i, (item_name, pdf_url, original_filename, link, key, from_cache) in enumerate(item_data):
             try:
                 base_name = original_filename.replace('.pdf', '')
 
@@ -297,9 +332,17 @@ class UnifiedDownloader:
                     final_filename = original_filename
 
                     # Download actual file
-                    session = requests.Session()
-                    session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-                    response = session.get(pdf_url, timeout=30)
+                    response = fetch(pdf_url)
+                    if response.status_code == 404 and from_cache:
+                        # Artwork was replaced since the URL was cached: fall back to the popup once
+                        print(f"♻️ Cached PDF URL for {item_name} is gone, re-resolving...")
+                        artwork_url_cache.invalidate(key)
+                        pdf_url = self.resolve_pdf_url(link)
+                        if not pdf_url:
+                            raise ValueError(f"No PDF URL for {item_name}")
+                        artwork_url_cache.store(key, pdf_url)
+                        response = fetch(pdf_url)
+                    artwork_url_cache.record_fetch(key, response)
                     response.raise_for_status()
 
                     file_path = os.path.join(download_folder, final_filename)
@@ -354,21 +397,16 @@ class UnifiedDownloader:
                 
                 # Click item
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", hyperlink)
-                original_windows = len(self.driver.window_handles)
+                handles_before = self.driver.window_handles
+                rate_limiter.acquire('app.e-brandid.com')
                 hyperlink.click()
                 
                 # Wait for new window
-                new_window_opened = False
-                wait_time = 30 if method == 1 else 15  # Standard method waits longer
+                wait_time = 3 if method == 1 else 1.5  # Standard method waits longer
+                popup = browser_tools.wait_for_new_window(self.driver, handles_before, timeout=wait_time)
                 
-                for wait_attempt in range(wait_time):
-                    time.sleep(0.1)
-                    if len(self.driver.window_handles) > original_windows:
-                        new_window_opened = True
-                        break
-                
-                if new_window_opened:
-                    self.driver.switch_to.window(self.driver.window_handles[-1])
+                if popup:
+                    browser_tools.switch_to_window(self.driver, popup)
                     
                     try:
                         download_element = WebDriverWait(self.driver, 5).until(
@@ -384,18 +422,11 @@ class UnifiedDownloader:
                         
                         download_element.click()
                         
-                        # Wait based on method
-                        if method == 1:  # Standard - wait longer
-                            time.sleep(5)
-                        else:  # Speed methods - wait less
-                            time.sleep(2)
-                        
-                        # Check for new files
-                        files_after = set(glob.glob(os.path.join(download_folder, "*.pdf")))
-                        new_files = files_after - files_before
+                        # Wait for the file, at most as long as each method used to sleep
+                        download_timeout = 5 if method == 1 else 2  # Standard - wait longer
+                        new_file = browser_tools.wait_for_download(download_folder, files_before, timeout=download_timeout)
                         
-                        if new_files:
-                            new_file = list(new_files)[0]
+                        if new_file:
                             
                             # Method-specific file handling
                             if method == 4 and 'target_filename' in locals():  # Clean naming
@@ -433,12 +464,6 @@ class UnifiedDownloader:
                 else:
                     failed_items.append(link_text)
                 
-                # Delay based on method
-                if method == 1:  # Standard - longer delay
-                    time.sleep(2)
-                else:  # Speed methods - shorter delay
-                    time.sleep(0.5)
-                
             except Exception as e:
                 failed_items.append(f"Item {i+1}")
                 continue
@@ -500,6 +525,7 @@ class UnifiedDownloader:
             # Show menu and get choices
             method = self.show_main_menu()
             po_number = self.get_po_and_options()
+            self.get_credentials()
 
             # Setup folder structure: Date folder / PO#_HH_MM_SS
             now = datetime.now()